@@ -2,6 +2,32 @@
 import sys
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Below this size converting to an array costs more than the scan saves.
+_ARRAY_MIN_SIZE = 256
+
+
+def _scan(orders, target: int) -> int:
+    """Return the index of the first order equal to target, or -1."""
+    for idx in range(len(orders)):
+        if orders[idx] == target:
+            return idx
+    return -1
+
+
+def _scan_vectorized(arr: np.ndarray, target: np.int64) -> int:
+    """Return the first index where arr == target, or -1, using one SIMD compare."""
+    mask = arr == target
+    idx = int(mask.argmax())
+    return idx if mask[idx] else -1
+
+
+_scan_native = njit(cache=True)(_scan) if njit is not None else None
+
 
 class OrderLookup:
     """Locate first occurrence of target order ID by linear scan"""
@@ -31,10 +57,16 @@ class OrderLookup:
             if order < -sys.maxsize - 1 or order > sys.maxsize:
                 raise ValueError()
 
-        comparisons = 0
-        for idx in range(size):
-            comparisons += 1
-            if orders[idx] == target:
-                return (idx, comparisons)
+        if size < _ARRAY_MIN_SIZE:
+            idx = _scan(orders, target)
+        else:
+            arr = np.asarray(orders, dtype=np.int64)
+            if _scan_native is not None:
+                idx = _scan_native(arr, np.int64(target))
+            else:
+                idx = _scan_vectorized(arr, np.int64(target))
 
-        return (-1, comparisons)
+        # The scan stops at the first match, so comparisons == idx + 1.
+        if idx < 0:
+            return (-1, size)
+        return (idx, idx + 1)
@@ -1,5 +1,6 @@
 
 from typing import List, Dict, Any, Optional
+import math
 import random
 
 __all__ = ["bootstrap", "query"]
@@ -79,17 +80,13 @@ def query(
     if value_min is not None and value_max is not None and value_min > value_max:
         raise ValueError("value_min cannot be greater than value_max")
 
+    # Resolve open bounds once so the filter is a single chained comparison
+    lo = value_min if value_min is not None else -math.inf
+    hi = value_max if value_max is not None else math.inf
+
     # Filter and return shallow copies
-    results: List[Dict[str, Any]] = []
-    for record in _store[tenant_id]:
-        val = record["value"]
-        if value_min is not None and val < value_min:
-            continue
-        if value_max is not None and val > value_max:
-            continue
-        results.append(record.copy())
-
-    return results
+    return [record.copy() for record in _store[tenant_id]
+            if lo <= record["value"] <= hi]
 
 
 def _generate_records(
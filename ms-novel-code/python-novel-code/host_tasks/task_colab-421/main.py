@@ -2,8 +2,13 @@
 """Simulate an in-memory TTL cache using cachetools with virtual time."""
 
 import cachetools
+import sys
 from typing import List
 
+_OP_SET = 0
+_OP_GET = 1
+_OP_SLEEP = 2
+
 
 def ttl_cache_simulator(commands: List[str]) -> List[str]:
     """Simulate a TTL cache using cachetools.TTLCache with virtual clock."""
@@ -15,27 +20,44 @@ def ttl_cache_simulator(commands: List[str]) -> List[str]:
 
     # Cache with max TTL to avoid premature eviction by the cache itself
     cache = cachetools.TTLCache(maxsize=10 ** 4, ttl=86400, timer=timer_func)
-    expiry_times = {}  # key -> expiry timestamp (virtual_time + ttl)
+    expiry_times = {}  # key -> absolute expiry timestamp
 
+    # Parse every command up front into (opcode, *args) tuples so the
+    # execution loop below only dispatches on small integers. Virtual time
+    # is fully determined by the SLEEP commands, so it is folded in here:
+    # SET carries its absolute expiry, GET the time it runs at, and SLEEP
+    # the clock value to jump to.
+    ops = []
+    now = 0
     for command_str in commands:
         parts = command_str.split()
-        command = parts[0]
+        # Interned so the keyword checks below hit the identity fast path
+        command = sys.intern(parts[0])
 
         if command == "EXIT":
             break
-
         elif command == "SET":
-            key, value, ttl_str = parts[1], parts[2], parts[3]
-            ttl = int(ttl_str)
+            ops.append((_OP_SET, parts[1], parts[2], now + int(parts[3])))
+        elif command == "GET":
+            ops.append((_OP_GET, parts[1], now))
+        elif command == "SLEEP":
+            now += int(parts[1])
+            ops.append((_OP_SLEEP, now))
+
+    for op in ops:
+        opcode = op[0]
+
+        if opcode == _OP_SET:
+            _, key, value, expiry = op
             cache[key] = value
-            expiry_times[key] = virtual_time + ttl  # track expiry
+            expiry_times[key] = expiry  # track expiry
 
-        elif command == "GET":
-            key = parts[1]
+        elif opcode == _OP_GET:
+            _, key, now = op
             expiry = expiry_times.get(key)
             value = cache.get(key)
 
-            if value is None or expiry is None or expiry <= virtual_time:
+            if value is None or expiry is None or expiry <= now:
                 # expired or missing
                 cache.pop(key, None)
                 expiry_times.pop(key, None)
@@ -43,9 +65,7 @@ def ttl_cache_simulator(commands: List[str]) -> List[str]:
             else:
                 outputs.append(value)
 
-        elif command == "SLEEP":
-            seconds = int(parts[1])
-            virtual_time += seconds
+        else:
+            virtual_time = op[1]
 
     return outputs
-
@@ -144,3 +144,8 @@ class TestTTLCacheSimulator(unittest.TestCase):
             "GET b", "EXIT"
         ]
         self.assertEqual(ttl_cache_simulator(cmds), ["NULL", "2", "NULL"])
+
+    def test_set_ignores_trailing_tokens(self):
+        """Tokens after the TTL of a SET are ignored."""
+        cmds = ["SET a va 2 extra", "GET a", "SLEEP 2", "GET a", "EXIT"]
+        self.assertEqual(ttl_cache_simulator(cmds), ["va", "NULL"])
@@ -6,9 +6,10 @@ Unit tests for job scheduling with timeout, logging, and error handling.
 
 import unittest
 import os
+import sys
 import time
 import tempfile
-from typing import Callable
+from typing import Any, Callable
 from pathlib import Path
 from main import (
     schedule_jobs,
@@ -37,6 +38,36 @@ def non_picklable_job() -> Callable:
     return lambda x: x
 
 
+_job_state = None
+
+
+def exit_job() -> None:
+    """Exits the process running it with status 3."""
+    sys.exit(3)
+
+
+def set_state_job() -> int:
+    """Sets a module global and returns it."""
+    global _job_state
+    _job_state = 5
+    return _job_state
+
+
+def get_state_job() -> Any:
+    """Returns the module global set by set_state_job, if any."""
+    return _job_state
+
+
+def large_bytes_job() -> bytes:
+    """Returns a 2 MiB bytes result."""
+    return bytes(range(256)) * 8192
+
+
+def large_bytearray_job() -> bytearray:
+    """Returns a 1 MiB bytearray result."""
+    return bytearray(b"\x07") * (1 << 20)
+
+
 class TestJobScheduler(unittest.TestCase):
     """Test cases for the job scheduler module."""
 
@@ -201,3 +232,65 @@ class TestJobScheduler(unittest.TestCase):
             log_file=self.log_file,
         )
         self.assertTrue(self.called)
+
+    def test_exiting_job_is_error_and_later_jobs_run(self) -> None:
+        """A job calling sys.exit is an error and does not stop the batch."""
+        result = schedule_jobs(
+            jobs=[("job15", exit_job), ("job16", fast_job)],
+            timeout=1.0,
+            follow_up=default_follow_up_logger,
+            log_file=self.log_file,
+        )
+        self.assertEqual(result[0]["status"], "error")
+        self.assertIn("no result received from child", result[0]["error"])
+        self.assertEqual(result[1]["status"], "ok")
+        self.assertEqual(result[1]["result"], 42)
+
+    def test_jobs_do_not_share_global_state(self) -> None:
+        """Globals set by one job are not visible to the next."""
+        result = schedule_jobs(
+            jobs=[("job17", set_state_job), ("job18", get_state_job)],
+            timeout=1.0,
+            follow_up=default_follow_up_logger,
+            log_file=self.log_file,
+        )
+        self.assertEqual(result[0]["result"], 5)
+        self.assertIsNone(result[1]["result"])
+
+    def test_jobs_run_after_timeout(self) -> None:
+        """Jobs after a timeout run normally, from a clean state."""
+        jobs = [
+            ("job19", set_state_job),
+            ("job20", slow_job),
+            ("job21", fast_job),
+            ("job22", get_state_job),
+        ]
+        result = schedule_jobs(
+            jobs=jobs,
+            timeout=0.5,
+            follow_up=default_follow_up_logger,
+            log_file=self.log_file,
+        )
+        statuses = [r["status"] for r in result]
+        self.assertEqual(statuses, ["ok", "timeout", "ok", "ok"])
+        self.assertEqual(result[2]["result"], 42)
+        self.assertIsNone(result[3]["result"])
+
+    @unittest.skipUnless(os.path.isdir("/dev/shm"), "needs /dev/shm")
+    def test_large_byte_results_round_trip(self) -> None:
+        """Large bytes and bytearray results arrive intact and leak no memory."""
+        before = set(os.listdir("/dev/shm"))
+        result = schedule_jobs(
+            jobs=[("job23", large_bytes_job), ("job24", large_bytearray_job)],
+            timeout=5.0,
+            follow_up=default_follow_up_logger,
+            log_file=self.log_file,
+        )
+        self.assertEqual(result[0]["status"], "ok")
+        self.assertIs(type(result[0]["result"]), bytes)
+        self.assertEqual(result[0]["result"], large_bytes_job())
+        self.assertEqual(result[1]["status"], "ok")
+        self.assertIs(type(result[1]["result"]), bytearray)
+        self.assertEqual(result[1]["result"], large_bytearray_job())
+        self.assertEqual(set(os.listdir("/dev/shm")) - before, set())
+
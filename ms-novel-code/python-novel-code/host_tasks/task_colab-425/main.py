@@ -7,11 +7,68 @@ handles complex nested structures, multiple file processing, and provides
 extensible parsing capabilities.
 """
 
+import codecs
+import mmap
 import os
 import re
+import stat
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import cached_property
+from logging.handlers import MemoryHandler
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# Block and inline patterns, compiled once at import time
+_RE_HEADER = re.compile(r'^(#{1,6})\s+(.*)')
+_RE_UL = re.compile(r'^[-*]\s+(.*)')
+_RE_OL = re.compile(r'^\d+\.\s+(.*)')
+
+# Links, bold and italic in one alternation so inline formatting is a single
+# left-to-right scan. Bold may wrap links, and italic may wrap links and bold;
+# the matched content is formatted recursively by the same pattern. Content
+# is written as unrolled loops, plain runs between links or '[', and for
+# italic text runs between bold spans: every step is unambiguous, so a
+# failed match backtracks linearly. Italic must not touch a literal '*' on
+# either side, but a bold span right after it, or a formatted span right
+# before it (see _format_nested), is no longer a '*' once converted.
+_LINK = r'\[[^\]]*\]\([^)]*\)'
+_TEXT = (r'[^*\n\[]*(?:(?:' + _LINK + r'|(?!' + _LINK + r')\[)'
+         r'[^*\n\[]*)*')
+_BOLD = r'\*\*(?!\s*\*\*)' + _TEXT + r'\*\*'
+_RE_INLINE = re.compile(
+    r'\[(?P<link_text>[^\]]*)\]\((?P<url>[^)]*)\)'
+    r'|\*\*(?P<bold>' + _TEXT + r')\*\*'
+    r'|(?<!\*)\*(?P<italic>' + _TEXT + r'(?:' + _BOLD + _TEXT + r')*)\*'
+    r'(?:(?!\*)|(?=' + _BOLD + r'))'
+)
+
+# Any character that escaping or inline formatting would act on
+_RE_INLINE_META = re.compile(r'[*\[&<>"\']')
+
+# Validates the binary-check chunk without failing on a split final character
+_UTF8_DECODER = codecs.getincrementaldecoder('utf-8')
+
+# Input files at least this large are memory-mapped rather than read
+_MMAP_MIN_SIZE = 64 * 1024
+
+# parse_batch only starts a process pool for at least this many files;
+# below it, worker start-up costs more than the parsing it spreads out
+_MIN_PARALLEL_FILES = 8
+
+# Chunks queued per pool worker, to balance uneven files against IPC cost
+_CHUNKS_PER_WORKER = 4
+
+# Translation table for _escape_html: one pass over the text in C
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
 
 
 class MarkdownParseError(Exception):
@@ -19,6 +76,41 @@ class MarkdownParseError(Exception):
     pass
 
 
+class _ForwardingHandler(logging.Handler):
+    """Handler that replays records through a logger's original handlers."""
+
+    def __init__(self, handlers: List[logging.Handler],
+                 parent: Optional[logging.Logger]):
+        super().__init__()
+        self._handlers = list(handlers)
+        self._parent = parent
+
+    def emit(self, record: logging.LogRecord):
+        for handler in self._handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        if self._parent is not None:
+            self._parent.callHandlers(record)
+
+
+class _CollectingHandler(logging.Handler):
+    """Handler that keeps records for a worker to return to its parent."""
+
+    def __init__(self):
+        super().__init__()
+        self.records: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord):
+        # Render arguments and tracebacks now, as they may not pickle
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(
+                record.exc_info)
+            record.exc_info = None
+        self.records.append(record)
+
+
 class MarkdownParser:
     """
     Advanced Markdown to HTML parser with support for nested structures
@@ -35,16 +127,31 @@ class MarkdownParser:
                 - max_nesting_depth: Maximum list nesting depth (default: 10)
                 - enable_logging: Enable debug logging (default: False)
                 - indent_size: HTML indentation size (default: 4)
+                - workers: Process pool size for parse_batch
+                  (default: os.cpu_count())
         """
         self.config = config if config else {}
         self.max_file_size = self.config.get('max_file_size', 100 * 1024 * 1024)
         self.max_nesting_depth = self.config.get('max_nesting_depth', 10)
         self.indent_size = self.config.get('indent_size', 4)
 
+        # Indent strings by nesting level, built once instead of per line
+        self._indent_unit = ' ' * self.indent_size
+        self._indents = [self._indent_unit * i
+                         for i in range(self.max_nesting_depth + 2)]
+
+    @cached_property
+    def logger(self) -> logging.Logger:
+        """
+        Logger for this parser, looked up (and configured) on first use.
+
+        Returns:
+            logging.Logger: The module logger
+        """
         if self.config.get('enable_logging', False):
             logging.basicConfig(level=logging.DEBUG)
 
-        self.logger = logging.getLogger(__name__)
+        return logging.getLogger(__name__)
 
     def parse_file(self, input_path: str, output_path: Optional[str] = None) -> str:
         """
@@ -62,30 +169,32 @@ class MarkdownParser:
             PermissionError: If unable to write output file
             MarkdownParseError: If parsing fails critically
         """
-        # Validate input file exists
-        if not os.path.isfile(input_path):
+        # Validate input file exists and check its size with a single stat
+        try:
+            file_stat = os.stat(input_path)
+        except OSError:
+            file_stat = None
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
             raise FileNotFoundError(f"Input file '{input_path}' not found")
 
         # Check file size constraint
-        file_size = os.path.getsize(input_path)
+        file_size = file_stat.st_size
         if file_size > self.max_file_size:
             raise MarkdownParseError(
                 f"File size {file_size} exceeds maximum allowed size "
                 f"{self.max_file_size}"
             )
 
-        # Check if file is binary
-        if self._is_binary_file(input_path):
-            raise MarkdownParseError(
-                f"File '{input_path}' appears to be binary, not text"
-            )
-
         try:
-            # Read the content with UTF-8 encoding
-            with open(input_path, 'r', encoding='utf-8', errors='replace') as file:
-                markdown_content = file.read()
-        except UnicodeDecodeError as e:
-            raise MarkdownParseError(f"Unicode decode error: {e}")
+            # Open once; the binary check and decode share the same bytes.
+            # Large files are decoded straight from a memory map so the raw
+            # bytes are never copied into a separate buffer.
+            with open(input_path, 'rb') as file:
+                if file_size >= _MMAP_MIN_SIZE:
+                    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        markdown_content = self._decode_content(mapped, input_path)
+                else:
+                    markdown_content = self._decode_content(file.read(), input_path)
         except IOError as e:
             raise PermissionError(f"Cannot read file '{input_path}': {e}")
 
@@ -94,18 +203,9 @@ class MarkdownParser:
 
         # Write output if output path is specified
         if output_path:
-            try:
-                # Create output directory if it has a directory component
-                output_dir = os.path.dirname(output_path)
-                if output_dir:  # Only create directory if there's a directory part
-                    os.makedirs(output_dir, exist_ok=True)
+            self._write_output(output_path, html_content)
 
-                with open(output_path, 'w', encoding='utf-8') as file:
-                    file.write(html_content)
-            except IOError as e:
-                raise PermissionError(f"Cannot write to '{output_path}': {e}") from e
-
-        self.logger.info(f"Successfully parsed '{input_path}'")
+        self.logger.info("Successfully parsed '%s'", input_path)
         return html_content
 
     def parse_batch(self, input_files: List[str],
@@ -126,28 +226,147 @@ class MarkdownParser:
         if output_directory:
             os.makedirs(output_directory, exist_ok=True)
 
-        for input_file in input_files:
-            try:
-                # Determine output path
-                if output_directory:
-                    output_filename = f"{Path(input_file).stem}.html"
-                    output_path = os.path.join(output_directory, output_filename)
-                else:
-                    # Place output file alongside input file
-                    input_path = Path(input_file)
-                    output_path = str(input_path.parent / f"{input_path.stem}.html")
+        # Log records are buffered and written once the batch is done
+        with self._buffered_logging():
+            parsed = self._parse_files(input_files)
+
+            # Write outputs in input order so colliding output paths resolve
+            # the same way as a sequential run
+            for input_file in input_files:
+                try:
+                    # Determine output path
+                    if output_directory:
+                        output_filename = f"{Path(input_file).stem}.html"
+                        output_path = os.path.join(output_directory, output_filename)
+                    else:
+                        # Place output file alongside input file
+                        input_path = Path(input_file)
+                        output_path = str(input_path.parent / f"{input_path.stem}.html")
+
+                    html_content = parsed[input_file]
+                    if isinstance(html_content, Exception):
+                        raise html_content
+
+                    self._write_output(output_path, html_content)
+                    results[input_file] = html_content
+
+                except (FileNotFoundError, PermissionError, MarkdownParseError) as e:
+                    results[input_file] = e
+                    self.logger.error("Error processing '%s': %s", input_file, e)
+                except Exception as e:
+                    results[input_file] = MarkdownParseError(f"Unexpected error: {e}")
+                    self.logger.error("Unexpected error processing '%s': %s",
+                                      input_file, e)
+
+        return results
 
-                html_content = self.parse_file(input_file, output_path)
-                results[input_file] = html_content
+    def _parse_files(self, input_files: List[str]) -> Dict[str, Union[str, Exception]]:
+        """
+        Parse several files, in parallel worker processes when possible.
 
-            except (FileNotFoundError, PermissionError, MarkdownParseError) as e:
-                results[input_file] = e
-                self.logger.error(f"Error processing '{input_file}': {e}")
+        Parsing is pure CPU work with no shared state, so files are handed
+        to a process pool with this parser's config, a few chunks per
+        worker so each task amortises its pickling and parser setup.
+        Small batches, a single worker, and chunks whose worker process
+        could not start or died are parsed in this process.
+
+        Args:
+            input_files (list): List of input file paths
+
+        Returns:
+            dict: Mapping of input files to HTML content or the raised exception
+        """
+        pending = list(dict.fromkeys(input_files))
+        outcomes: Dict[str, Union[str, Exception]] = {}
+
+        workers = min(len(pending),
+                      self.config.get('workers') or os.cpu_count() or 1)
+        if workers > 1 and len(pending) >= _MIN_PARALLEL_FILES:
+            chunk_size = -(-len(pending) // (workers * _CHUNKS_PER_WORKER))
+            chunks = [pending[i:i + chunk_size]
+                      for i in range(0, len(pending), chunk_size)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = {}
+                for chunk in chunks:
+                    try:
+                        future = executor.submit(_parse_files_worker,
+                                                 self.config, chunk)
+                    except (OSError, BrokenProcessPool):
+                        # Workers could not be started: parse the rest here
+                        break
+                    futures[future] = chunk
+                for future in as_completed(futures):
+                    chunk = futures[future]
+                    try:
+                        results, records = future.result()
+                    except BrokenProcessPool:
+                        # A worker died, e.g. killed by the OOM killer or
+                        # unable to import this module: the chunk's files
+                        # are fine, so parse them in this process instead
+                        results, records = _parse_files_worker(self.config,
+                                                               chunk)
+                    except Exception as e:
+                        results, records = [e] * len(chunk), []
+                    outcomes.update(zip(chunk, results))
+                    # Replay the worker's log records through this logger,
+                    # and so through parse_batch's buffer
+                    for record in records:
+                        if self.logger.isEnabledFor(record.levelno):
+                            self.logger.handle(record)
+            pending = [path for path in pending if path not in outcomes]
+
+        for input_file in pending:
+            try:
+                outcomes[input_file] = self.parse_file(input_file)
             except Exception as e:
-                results[input_file] = MarkdownParseError(f"Unexpected error: {e}")
-                self.logger.error(f"Unexpected error processing '{input_file}': {e}")
+                outcomes[input_file] = e
+        return outcomes
 
-        return results
+    def _write_output(self, output_path: str, html_content: str):
+        """
+        Write generated HTML to output_path, creating its directory if needed.
+
+        Args:
+            output_path (str): Path for output HTML file
+            html_content (str): Generated HTML content
+
+        Raises:
+            PermissionError: If unable to write output file
+        """
+        try:
+            # Create output directory if it has a directory component
+            output_dir = os.path.dirname(output_path)
+            if output_dir:  # Only create directory if there's a directory part
+                os.makedirs(output_dir, exist_ok=True)
+
+            Path(output_path).write_text(html_content, encoding='utf-8')
+        except IOError as e:
+            raise PermissionError(f"Cannot write to '{output_path}': {e}") from e
+
+    @contextmanager
+    def _buffered_logging(self, capacity: int = 1000) -> Iterator[None]:
+        """
+        Buffer this parser's log records while the block runs.
+
+        Records are held in a MemoryHandler and replayed through the logger's
+        usual handlers when the buffer fills, an error is logged, or the
+        block exits.
+
+        Args:
+            capacity (int): Number of records to hold before flushing
+        """
+        logger = self.logger
+        saved_handlers, saved_propagate = logger.handlers, logger.propagate
+        forward = _ForwardingHandler(
+            saved_handlers, logger.parent if saved_propagate else None)
+        buffer = MemoryHandler(capacity, flushLevel=logging.ERROR, target=forward)
+
+        logger.handlers, logger.propagate = [buffer], False
+        try:
+            yield
+        finally:
+            logger.handlers, logger.propagate = saved_handlers, saved_propagate
+            buffer.close()
 
     def parse_string(self, markdown_content: str) -> str:
         """
@@ -176,9 +395,8 @@ class MarkdownParser:
             '<body>'
         ])
 
-        # Parse content
-        body_content = self._parse_content(lines)
-        html_lines.extend(body_content)
+        # Parse content straight into the document
+        self._parse_content(lines, html_lines)
 
         # Close HTML structure
         html_lines.extend([
@@ -188,47 +406,64 @@ class MarkdownParser:
 
         return '\n'.join(html_lines)
 
-    def _parse_content(self, lines: List[str]) -> List[str]:
+    def _parse_content(self, lines: List[str], html_lines: List[str],
+                       base_indent: int = 0, start: int = 0,
+                       end: Optional[int] = None,
+                       block_ends: Optional[List[int]] = None) -> List[str]:
         """
         Parse the main content of the markdown.
 
+        Nested list content is parsed in place as the range start:end of the
+        same lines, with base_indent > 0. Blank lines inside nested content
+        are ignored, so they do not split its paragraphs.
+
         Args:
             lines (list): List of markdown lines
+            html_lines (list): HTML output lines, appended to in place
+            base_indent (int): Extra indentation levels for nested content
+            start (int): Index of the first line to parse
+            end (int, optional): Index past the last line to parse
+            block_ends (list, optional): Result of _find_block_ends(lines)
 
         Returns:
-            list: List of HTML lines with proper indentation
+            list: html_lines, for convenience
         """
-        html_lines = []
+        if end is None:
+            end = len(lines)
+        if block_ends is None:
+            block_ends = self._find_block_ends(lines)
+
         list_stack = []
         in_paragraph = False
         paragraph_lines = []
 
-        i = 0
-        while i < len(lines):
+        i = start
+        while i < end:
             line = lines[i]
             line = line.rstrip()
 
             # Handle empty lines
             if not line:
-                if in_paragraph:
-                    self._close_paragraph(paragraph_lines, html_lines)
+                if in_paragraph and not base_indent:
+                    self._close_paragraph(paragraph_lines, html_lines, base_indent)
                     in_paragraph = False
                     paragraph_lines = []
                 i += 1
                 continue
 
-            # Check for headers
-            header_match = re.match(r'^(#{1,6})\s+(.*)', line)
+            # Check for headers; only lines starting with '#' can match
+            header_match = line[0] == '#' and _RE_HEADER.match(line)
             if header_match:
                 if in_paragraph:
-                    self._close_paragraph(paragraph_lines, html_lines)
+                    self._close_paragraph(paragraph_lines, html_lines, base_indent)
                     in_paragraph = False
                     paragraph_lines = []
 
-                self._close_all_lists(list_stack, html_lines)
+                self._close_all_lists(list_stack, html_lines, base_indent)
                 level = len(header_match.group(1))
                 content = self._parse_inline_formatting(header_match.group(2))
-                html_lines.append(f'    <h{level}>{content}</h{level}>')
+                html_lines.append(
+                    f"{self._indent(base_indent + 1)}<h{level}>{content}</h{level}>")
                 i += 1
                 continue
 
@@ -236,7 +471,7 @@ class MarkdownParser:
             list_match = self._match_list_item(line)
             if list_match:
                 if in_paragraph:
-                    self._close_paragraph(paragraph_lines, html_lines)
+                    self._close_paragraph(paragraph_lines, html_lines, base_indent)
                     in_paragraph = False
                     paragraph_lines = []
 
@@ -245,13 +480,13 @@ class MarkdownParser:
                 # Handle nested lists
                 i = self._handle_list_item(
                     lines, i, indent_level, list_type, content,
-                    list_stack, html_lines
+                    list_stack, html_lines, base_indent, block_ends
                 )
                 continue
 
             # Regular paragraph text
             if list_stack:
-                self._close_all_lists(list_stack, html_lines)
+                self._close_all_lists(list_stack, html_lines, base_indent)
 
             if not in_paragraph:
                 in_paragraph = True
@@ -262,12 +497,62 @@ class MarkdownParser:
 
         # Close any remaining open elements
         if in_paragraph:
-            self._close_paragraph(paragraph_lines, html_lines)
+            self._close_paragraph(paragraph_lines, html_lines, base_indent)
 
-        self._close_all_lists(list_stack, html_lines)
+        self._close_all_lists(list_stack, html_lines, base_indent)
 
         return html_lines
 
+    def _find_block_ends(self, lines: List[str]) -> List[int]:
+        """
+        Find where the indented block under each line ends.
+
+        For each non-blank line, this is the index of the next non-blank line
+        indented no deeper than it (len(lines) if there is none). Computed in
+        one backward pass so nested lists do not rescan their content once
+        per nesting level.
+
+        Args:
+            lines (list): List of markdown lines
+
+        Returns:
+            list: Block end index for each line
+        """
+        count = len(lines)
+        block_ends = [count] * count
+        # (indent, index) of later non-blank lines, indents increasing upward
+        stack = []
+
+        for i in range(count - 1, -1, -1):
+            line = lines[i]
+            stripped_line = line.lstrip()
+            if not stripped_line:
+                continue
+
+            indent = len(line) - len(stripped_line)
+            while stack and stack[-1][0] > indent:
+                stack.pop()
+            if stack:
+                block_ends[i] = stack[-1][1]
+            stack.append((indent, i))
+
+        return block_ends
+
+    def _indent(self, level: int) -> str:
+        """
+        Get the indentation string for a nesting level.
+
+        Args:
+            level (int): Nesting level
+
+        Returns:
+            str: indent_size spaces repeated level times
+        """
+        indents = self._indents
+        while level >= len(indents):
+            indents.append(self._indent_unit * len(indents))
+        return indents[level]
+
     def _match_list_item(self, line: str) -> Optional[tuple]:
         """
         Match and extract list item information.
@@ -278,25 +563,36 @@ class MarkdownParser:
         Returns:
             tuple: (indent_level, list_type, content) or None
         """
-        # Calculate indentation
-        indent_level = len(line) - len(line.lstrip())
-        stripped_line = line.lstrip()
+        # Calculate indentation; unindented lines need no stripped copy
+        if line[:1].isspace():
+            stripped_line = line.lstrip()
+            indent_level = len(line) - len(stripped_line)
+        else:
+            stripped_line = line
+            indent_level = 0
+
+        # The first character decides which pattern, if any, can match
+        marker = stripped_line[:1]
 
         # Check for unordered list
-        ul_match = re.match(r'^[-*]\s+(.*)', stripped_line)
-        if ul_match:
-            return (indent_level, 'ul', ul_match.group(1))
+        if marker == '-' or marker == '*':
+            ul_match = _RE_UL.match(stripped_line)
+            if ul_match:
+                return (indent_level, 'ul', ul_match.group(1))
 
         # Check for ordered list
-        ol_match = re.match(r'^\d+\.\s+(.*)', stripped_line)
-        if ol_match:
-            return (indent_level, 'ol', ol_match.group(1))
+        elif marker.isdecimal():
+            ol_match = _RE_OL.match(stripped_line)
+            if ol_match:
+                return (indent_level, 'ol', ol_match.group(1))
 
         return None
 
     def _handle_list_item(self, lines: List[str], start_index: int,
                          indent_level: int, list_type: str, content: str,
-                         list_stack: List[tuple], html_lines: List[str]) -> int:
+                         list_stack: List[tuple], html_lines: List[str],
+                         base_indent: int = 0,
+                         block_ends: Optional[List[int]] = None) -> int:
         """
         Handle a list item and its potential nested content.
 
@@ -308,48 +604,39 @@ class MarkdownParser:
             content (str): Content of the list item
             list_stack (list): Stack tracking open lists
             html_lines (list): HTML output lines
+            base_indent (int): Extra indentation levels for nested content
+            block_ends (list, optional): Result of _find_block_ends(lines)
 
         Returns:
             int: Next line index to process
         """
         # Adjust list stack based on indentation
-        self._adjust_list_stack(indent_level, list_type, list_stack, html_lines)
+        self._adjust_list_stack(indent_level, list_type, list_stack, html_lines,
+                                base_indent)
 
         # Parse the list item content
         parsed_content = self._parse_inline_formatting(content)
 
-        # Check if this item has nested content
-        next_index = start_index + 1
-        nested_content = []
-
-        while next_index < len(lines):
-            next_line = lines[next_index]
-            if not next_line.strip():
-                next_index += 1
-                continue
-
-            next_indent = len(next_line) - len(next_line.lstrip())
+        # Everything up to the next line indented no deeper is nested content
+        if block_ends is None:
+            block_ends = self._find_block_ends(lines)
+        next_index = block_ends[start_index]
 
-            # If next line is more indented, it's nested content
-            if next_indent > indent_level:
-                nested_content.append(next_line)
-                next_index += 1
-            else:
-                break
+        # Nested content exists if a non-blank line comes before that point
+        first_nested = start_index + 1
+        while first_nested < next_index and not lines[first_nested].strip():
+            first_nested += 1
+        has_nested_content = first_nested < next_index
 
         # Generate list item HTML
-        current_indent = '    ' * (len(list_stack) + 1)
+        current_indent = self._indent(base_indent + len(list_stack) + 1)
 
-        if nested_content:
+        if has_nested_content:
             html_lines.append(f'{current_indent}<li>{parsed_content}')
 
-            # Parse nested content
-            nested_html = self._parse_content(nested_content)
-
-            # Add nested HTML with proper indentation
-            for nested_line in nested_html:
-                if nested_line.strip():
-                    html_lines.append(f'    {nested_line}')
+            # Parse nested content one level deeper, directly into html_lines
+            self._parse_content(lines, html_lines, base_indent + 1,
+                                first_nested, next_index, block_ends)
 
             html_lines.append(f'{current_indent}</li>')
         else:
@@ -358,7 +645,8 @@ class MarkdownParser:
         return next_index
 
     def _adjust_list_stack(self, indent_level: int, list_type: str,
-                          list_stack: List[tuple], html_lines: List[str]):
+                          list_stack: List[tuple], html_lines: List[str],
+                          base_indent: int = 0):
         """
         Adjust the list stack based on current indentation level.
 
@@ -367,12 +655,13 @@ class MarkdownParser:
             list_type (str): Type of list ('ul' or 'ol')
             list_stack (list): Stack of open lists
             html_lines (list): HTML output lines
+            base_indent (int): Extra indentation levels for nested content
         """
         # Close lists that are at deeper or equal indentation
         while (list_stack and
                list_stack[-1][0] >= indent_level):
             _, old_type = list_stack.pop()
-            current_indent = '    ' * (len(list_stack) + 1)
+            current_indent = self._indent(base_indent + len(list_stack) + 1)
             html_lines.append(f'{current_indent}</{old_type}>')
 
         # Check if we need to start a new list
@@ -381,34 +670,39 @@ class MarkdownParser:
             list_stack[-1][1] != list_type):
 
             list_stack.append((indent_level, list_type))
-            current_indent = '    ' * len(list_stack)
+            current_indent = self._indent(base_indent + len(list_stack))
             html_lines.append(f'{current_indent}<{list_type}>')
 
-    def _close_all_lists(self, list_stack: List[tuple], html_lines: List[str]):
+    def _close_all_lists(self, list_stack: List[tuple], html_lines: List[str],
+                         base_indent: int = 0):
         """
         Close all open lists in the stack.
 
         Args:
             list_stack (list): Stack of open lists
             html_lines (list): HTML output lines
+            base_indent (int): Extra indentation levels for nested content
         """
         while list_stack:
             _, list_type = list_stack.pop()
-            current_indent = '    ' * (len(list_stack) + 1)
+            current_indent = self._indent(base_indent + len(list_stack) + 1)
             html_lines.append(f'{current_indent}</{list_type}>')
 
-    def _close_paragraph(self, paragraph_lines: List[str], html_lines: List[str]):
+    def _close_paragraph(self, paragraph_lines: List[str], html_lines: List[str],
+                         base_indent: int = 0):
         """
         Close a paragraph and add it to HTML output.
 
         Args:
             paragraph_lines (list): Lines of the paragraph
             html_lines (list): HTML output lines
+            base_indent (int): Extra indentation levels for nested content
         """
         if paragraph_lines:
             content = ' '.join(paragraph_lines)
             parsed_content = self._parse_inline_formatting(content)
-            html_lines.append(f'    <p>{parsed_content}</p>')
+            html_lines.append(
+                f"{self._indent(base_indent + 1)}<p>{parsed_content}</p>")
 
     def _parse_inline_formatting(self, text: str) -> str:
         """
@@ -420,101 +714,87 @@ class MarkdownParser:
         Returns:
             str: Text with inline formatting converted to HTML
         """
+        # Plain prose needs neither escaping nor formatting
+        if not _RE_INLINE_META.search(text):
+            return text
+
         # Escape HTML special characters first
         text = self._escape_html(text)
 
-        # Handle links first (they can contain other formatting)
-        text = self._parse_links(text)
-
-        # Handle bold text (must come before italic to avoid conflicts)
-        text = self._parse_bold(text)
+        # Links, bold and italic in a single pass
+        return self._format_nested(text)
 
-        # Handle italic text
-        text = self._parse_italic(text)
-
-        return text
-
-    def _parse_links(self, text: str) -> str:
+    def _replace_inline(self, match: re.Match) -> str:
         """
-        Parse markdown links and convert to HTML.
+        Convert one link, bold or italic match from _RE_INLINE to HTML.
 
         Args:
-            text (str): Text containing potential links
+            match (re.Match): Match of the combined inline pattern
 
         Returns:
-            str: Text with links converted to HTML
+            str: HTML for the match, or the original text if not convertible
         """
-        # Handle malformed links gracefully
-        def replace_link(match):
-            link_text = match.group(1)
-            url = match.group(2)
+        url = match.group('url')
+        if url is not None:
+            link_text = match.group('link_text')
 
             # Basic URL validation and length check
             if len(url) > 2048:
-                return match.group(0)  # Return original if URL too long
-
-            # Parse inline formatting within link text
-            formatted_text = self._parse_bold(self._parse_italic(link_text))
+                # Leave the link syntax as is but still format its parts
+                return (f'[{self._format_nested(link_text)}]'
+                        f'({self._format_nested(url)})')
 
-            return f'<a href="{url}">{formatted_text}</a>'
-
-        # Match [text](url) pattern with error recovery
-        try:
-            text = re.sub(r'\[([^\]]*)\]\(([^)]*)\)', replace_link, text)
-        except Exception:
-            # If regex fails, return original text
-            pass
+            return f'<a href="{url}">{self._format_nested(link_text)}</a>'
 
-        return text
-
-    def _parse_bold(self, text: str) -> str:
-        """
-        Parse bold formatting and convert to HTML.
-
-        Args:
-            text (str): Text containing potential bold formatting
-
-        Returns:
-            str: Text with bold formatting converted to HTML
-        """
-        # Handle nested and malformed bold markers gracefully
-        def replace_bold(match):
-            content = match.group(1)
-            if content.strip():  # Only convert non-empty content
-                return f'<strong>{content}</strong>'
-            return match.group(0)  # Return original if empty
-
-        try:
-            # Match **text** but handle unclosed markers gracefully
-            text = re.sub(r'\*\*([^*\n]*?)\*\*', replace_bold, text)
-        except Exception:
-            pass
+        content = match.group('bold')
+        if content is not None:
+            tag = 'strong'
+        else:
+            content = match.group('italic')
+            tag = 'em'
 
-        return text
+        # Only convert non-empty content
+        if not content.strip():
+            return match.group(0)
+        return f'<{tag}>{self._format_nested(content)}</{tag}>'
 
-    def _parse_italic(self, text: str) -> str:
+    def _format_nested(self, text: str) -> str:
         """
-        Parse italic formatting and convert to HTML.
+        Apply inline formatting to already-escaped text.
 
         Args:
-            text (str): Text containing potential italic formatting
+            text (str): Escaped line, or content of a link, bold or italic span
 
         Returns:
-            str: Text with italic formatting converted to HTML
-        """
-        def replace_italic(match):
-            content = match.group(1)
-            if content.strip():  # Only convert non-empty content
-                return f'<em>{content}</em>'
-            return match.group(0)  # Return original if empty
-
-        try:
-            # Match *text* but avoid matching ** patterns and handle unclosed
-            text = re.sub(r'(?<!\*)\*([^*\n]*?)\*(?!\*)', replace_italic, text)
-        except Exception:
-            pass
-
-        return text
+            str: Content with nested inline formatting converted to HTML
+        """
+        if '*' not in text and '[' not in text:
+            return text
+
+        # The italic lookbehind can only misfire on a converted bold's
+        # closing '**' followed by an opening '*'
+        if '***' not in text:
+            return _RE_INLINE.sub(self._replace_inline, text)
+
+        # Like re.sub, but after a converted span ending in '*' the italic
+        # lookbehind only sees the text after it: that '*' became a tag
+        parts = []
+        view = text
+        pos = 0
+        while True:
+            match = _RE_INLINE.search(view, pos)
+            if match is None:
+                break
+            replacement = self._replace_inline(match)
+            parts.append(view[pos:match.start()])
+            parts.append(replacement)
+            pos = match.end()
+            if (view.startswith('*', pos) and view[pos - 1] == '*'
+                    and replacement != match.group(0)):
+                view = view[pos:]
+                pos = 0
+        parts.append(view[pos:])
+        return ''.join(parts)
 
     def _escape_html(self, text: str) -> str:
         """
@@ -526,18 +806,7 @@ class MarkdownParser:
         Returns:
             str: Text with HTML characters escaped
         """
-        html_escape_table = {
-            '&': '&amp;',
-            '<': '&lt;',
-            '>': '&gt;',
-            '"': '&quot;',
-            "'": '&#x27;',
-        }
-
-        for char, escape in html_escape_table.items():
-            text = text.replace(char, escape)
-
-        return text
+        return text.translate(_HTML_ESCAPE_TABLE)
 
     def _normalize_line_endings(self, content: str) -> str:
         """
@@ -549,38 +818,63 @@ class MarkdownParser:
         Returns:
             str: Content with normalized line endings
         """
+        # Unix-only content (the common case) needs no copies
+        if '\r' not in content:
+            return content
+
         # Convert Windows and Mac line endings to Unix
         content = content.replace('\r\n', '\n')
         content = content.replace('\r', '\n')
         return content
 
-    def _is_binary_file(self, file_path: str) -> bool:
+    def _decode_content(self, data, input_path: str) -> str:
         """
-        Check if a file is binary by examining its content.
+        Check raw file content for binary data and decode it as UTF-8.
 
         Args:
-            file_path (str): Path to the file to check
+            data (bytes or mmap.mmap): Raw file content
+            input_path (str): Path of the file, for error messages
 
         Returns:
-            bool: True if file appears to be binary
+            str: Decoded content, with invalid bytes replaced
+
+        Raises:
+            MarkdownParseError: If the content appears to be binary
         """
-        try:
-            with open(file_path, 'rb') as file:
-                chunk = file.read(1024)  # Read first 1KB
+        # Check if file is binary
+        if self._is_binary_content(data[:1024]):
+            raise MarkdownParseError(
+                f"File '{input_path}' appears to be binary, not text"
+            )
 
-            # Check for null bytes (common in binary files)
-            if b'\x00' in chunk:
-                return True
+        # str() decodes straight from the buffer without a bytes copy
+        return str(data, 'utf-8', 'replace')
 
-            # Try to decode as UTF-8
-            try:
-                chunk.decode('utf-8')
-                return False
-            except UnicodeDecodeError:
-                return True
+    def _is_binary_content(self, chunk: bytes) -> bool:
+        """
+        Check if file content is binary by examining its first bytes.
+
+        Args:
+            chunk (bytes): Leading bytes of the file (first 1KB)
 
-        except (IOError, OSError):
-            return True  # Assume binary if can't read
+        Returns:
+            bool: True if content appears to be binary
+        """
+        # Check for null bytes (common in binary files)
+        if b'\x00' in chunk:
+            return True
+
+        # ASCII is valid UTF-8; no need to decode anything
+        if chunk.isascii():
+            return False
+
+        # Validate as UTF-8; a character cut off at the end of the chunk is
+        # left pending rather than treated as an error
+        try:
+            _UTF8_DECODER(errors='strict').decode(chunk, final=False)
+            return False
+        except UnicodeDecodeError:
+            return True
 
     def _generate_empty_html(self) -> str:
         """
@@ -602,6 +896,40 @@ class MarkdownParser:
         ])
 
 
+def _parse_files_worker(
+        config: Dict, input_paths: List[str]
+) -> Tuple[List[Union[str, Exception]], List[logging.LogRecord]]:
+    """
+    Process pool entry point for MarkdownParser.parse_batch.
+
+    The parser's log records are collected rather than emitted, so the
+    submitting process can log them alongside its own.
+
+    Args:
+        config (dict): Configuration of the submitting parser
+        input_paths (list): Chunk of input Markdown file paths
+
+    Returns:
+        tuple: HTML content or the raised exception for each input path,
+            and the log records emitted while parsing them
+    """
+    parser = MarkdownParser(config)
+    logger = parser.logger
+    collector = _CollectingHandler()
+    saved_handlers, saved_propagate = logger.handlers, logger.propagate
+    logger.handlers, logger.propagate = [collector], False
+    results: List[Union[str, Exception]] = []
+    try:
+        for input_path in input_paths:
+            try:
+                results.append(parser.parse_file(input_path))
+            except Exception as e:
+                results.append(e)
+    finally:
+        logger.handlers, logger.propagate = saved_handlers, saved_propagate
+    return results, collector.records
+
+
 def convert_markdown_to_html(input_path: str, output_path: Optional[str] = None,
                            config: Optional[Dict] = None) -> str:
     """
@@ -4,6 +4,9 @@
 import unittest
 import tempfile
 import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from unittest.mock import patch
 from main import MarkdownParser, MarkdownParseError, convert_markdown_to_html
 
 
@@ -53,6 +56,24 @@ class TestMarkdownParser(unittest.TestCase):
         self.assertIn(
             '<a href="https://bold.com"><strong>Bold Link</strong></a>', html)
 
+    def test_link_formatted_once(self):
+        """Test that link URLs and formatted link text are not re-parsed."""
+        html = self.parser.parse_string(
+            "[*it* and **b**](https://e.com/a*b*c) then *after*")
+        self.assertIn(
+            '<a href="https://e.com/a*b*c"><em>it</em> and '
+            '<strong>b</strong></a> then <em>after</em>', html)
+
+    def test_bold_then_adjacent_italic(self):
+        """Test italic directly after a bold span."""
+        html = self.parser.parse_string("**bold***italic*")
+        self.assertIn("<strong>bold</strong><em>italic</em>", html)
+
+    def test_italic_then_adjacent_bold(self):
+        """Test bold directly after an italic span."""
+        html = self.parser.parse_string("*a***b**")
+        self.assertIn("<em>a</em><strong>b</strong>", html)
+
     def test_unordered_list(self):
         """Test rendering of a basic unordered list."""
         md = "- Item 1\n- Item 2"
@@ -181,3 +202,66 @@ class TestMarkdownParser(unittest.TestCase):
         md = "\n".join(f"- Item {i}" for i in range(1000))
         html = self.parser.parse_string(md)
         self.assertEqual(html.count("<li>"), 1000)
+
+    def _write_list_files(self, directory, count, items=200):
+        """Write count list-heavy Markdown files and return their paths."""
+        paths = []
+        for i in range(count):
+            path = os.path.join(directory, f"doc{i}.md")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(f"# Doc {i}\n")
+                f.write("\n".join(f"- Item **{j}**" for j in range(items)))
+            paths.append(path)
+        return paths
+
+    def test_parse_batch_many_files_in_worker_processes(self):
+        """Test batch parsing of many files through the process pool."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._write_list_files(tmpdir, 8)
+            with patch("main.os.cpu_count", return_value=4):
+                result = self.parser.parse_batch(paths)
+            self.assertEqual(len(result), 8)
+            for i, path in enumerate(paths):
+                self.assertIsInstance(result[path], str)
+                self.assertIn(f"<h1>Doc {i}</h1>", result[path])
+                self.assertEqual(result[path].count("<li>"), 200)
+                self.assertTrue(
+                    os.path.exists(os.path.join(tmpdir, f"doc{i}.html")))
+
+    def test_parse_batch_worker_chunk_keeps_per_file_errors(self):
+        """Test that a failing file does not fail the rest of its chunk."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._write_list_files(tmpdir, 8, items=5)
+            bad_file = os.path.join(tmpdir, "bad.md")
+            os.mkdir(bad_file)
+            parser = MarkdownParser(config={"workers": 2})
+            result = parser.parse_batch(paths + [bad_file])
+            self.assertIsInstance(result[bad_file], FileNotFoundError)
+            for path in paths:
+                self.assertIn("<li>Item <strong>4</strong></li>",
+                              result[path])
+
+    def test_parse_batch_broken_pool_parses_in_process(self):
+        """Test that chunks of a dead worker pool are parsed in-process."""
+        # Every worker exits while starting up, which breaks the pool
+        broken_pool = partial(ProcessPoolExecutor,
+                              initializer=os._exit, initargs=(1,))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._write_list_files(tmpdir, 8, items=3)
+            parser = MarkdownParser(config={"workers": 2})
+            with patch("main.ProcessPoolExecutor", broken_pool):
+                result = parser.parse_batch(paths)
+            self.assertEqual(len(result), 8)
+            for i, path in enumerate(paths):
+                self.assertIn(f"<h1>Doc {i}</h1>", result[path])
+
+    def test_parse_batch_logs_worker_records_in_parent(self):
+        """Test that log records from worker processes reach the batch log."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            paths = self._write_list_files(tmpdir, 8, items=3)
+            parser = MarkdownParser(config={"workers": 2})
+            with self.assertLogs("main", level="INFO") as logs:
+                parser.parse_batch(paths)
+            for path in paths:
+                self.assertIn(f"INFO:main:Successfully parsed '{path}'",
+                              logs.output)
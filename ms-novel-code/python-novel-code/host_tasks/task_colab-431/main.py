@@ -4,6 +4,8 @@
 from collections import deque
 from typing import List
 
+import numpy as np
+
 
 def bfs_traversal(matrix: List[List[int]], start_node: int) -> List[int]:
     """
@@ -26,35 +28,56 @@ def bfs_traversal(matrix: List[List[int]], start_node: int) -> List[int]:
     if n == 0:
         raise ValueError("Input matrix cannot be empty.")
 
-    for i, row in enumerate(matrix):
+    # Collect the distinct cell values with C-level set updates instead of
+    # testing every cell in Python; the diagonal is checked separately.
+    values = set()
+    for row in matrix:
         if len(row) != n:
             raise ValueError("Input matrix must be square.")
-        for j, value in enumerate(row):
-            if value not in (0, 1):
-                raise ValueError("Matrix values must be 0 or 1.")
-            if i == j and value != 0:
-                raise ValueError(
-                    "Matrix must not contain self-loops (matrix[i][i] == 0)."
-                    )
+        try:
+            values.update(row)
+        except TypeError:
+            raise ValueError("Matrix values must be 0 or 1.") from None
+    if not values <= {0, 1}:
+        raise ValueError("Matrix values must be 0 or 1.")
+    if any(matrix[i][i] for i in range(n)):
+        raise ValueError(
+            "Matrix must not contain self-loops (matrix[i][i] == 0)."
+            )
 
     if not (0 <= start_node < n):
         raise IndexError("Starting node index is out of bounds.")
 
-    visited = [False] * n
+    # Each row becomes a Python int with bit j set for an edge to j, so the
+    # unvisited neighbours of a node are one bignum AND. Peeling off the
+    # lowest set bit yields ascending indices, keeping the visiting order.
+    # Validated integer rows pack straight into a bool buffer; float rows
+    # such as 1.0 cannot go through bytes(), and NumPy rows wider than one
+    # byte per cell give a buffer of the wrong size, so both take the
+    # slower conversion.
+    try:
+        adjacency = np.frombuffer(
+            b"".join(map(bytes, matrix)), dtype=np.bool_).reshape(n, n)
+    except (TypeError, ValueError):
+        adjacency = np.asarray(matrix, dtype=bool)
+    packed = np.packbits(adjacency, axis=1, bitorder="little")
+    rows = [int.from_bytes(row.tobytes(), "little") for row in packed]
+
+    visited = 1 << start_node
     queue = deque()
     traversal_order = []
 
-    visited[start_node] = True
     queue.append(start_node)
 
     while queue:
         current_node = queue.popleft()
         traversal_order.append(current_node)
 
-        for neighbor in range(n):
-            if matrix[current_node][neighbor] == 1 and not visited[neighbor]:
-                visited[neighbor] = True
-                queue.append(neighbor)
+        candidates = rows[current_node] & ~visited
+        visited |= candidates
+        while candidates:
+            lowest = candidates & -candidates
+            queue.append(lowest.bit_length() - 1)
+            candidates ^= lowest
 
     return traversal_order
-
@@ -2,6 +2,7 @@
 
 """Unit tests for the bfs_traversal function."""
 import unittest
+import numpy as np
 from main import bfs_traversal
 
 
@@ -97,6 +98,16 @@ class TestBFSTraversal(unittest.TestCase):
         ]
         self.assertEqual(bfs_traversal(matrix, 0), [0, 1, 2, 3])
 
+    def test_numpy_int64_rows(self):
+        """Test BFS on a matrix whose rows are NumPy int64 arrays."""
+        matrix = np.array([
+            [0, 1, 1, 0],
+            [0, 0, 0, 1],
+            [0, 0, 0, 1],
+            [0, 0, 0, 0]
+        ], dtype=np.int64)
+        self.assertEqual(bfs_traversal(list(matrix), 0), [0, 1, 2, 3])
+
 
 if __name__ == "__main__":
     unittest.main()
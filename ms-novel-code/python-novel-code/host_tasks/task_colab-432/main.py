@@ -1,9 +1,342 @@
 
 """This module implements a PacketAnalyzer class using scapy"""
 
+import heapq
+import importlib.util
 import ipaddress
-from collections import Counter
-import scapy.all as scapy
+import mmap
+import socket
+import struct
+import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from operator import itemgetter
+
+try:
+    import dpkt
+except ImportError:
+    dpkt = None
+
+
+def _lazy_import(name: str):
+    """
+    Import a module whose body only runs on first attribute access.
+
+    Parameters:
+        name (str): Fully qualified module name.
+
+    Returns:
+        module: The module, loaded lazily unless it was already imported.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    # A real import also binds a submodule on its package, so that
+    # "import scapy.all" elsewhere can reach it as scapy.all
+    parent, _, child = name.rpartition(".")
+    if parent:
+        setattr(sys.modules[parent], child, module)
+    return module
+
+
+# scapy.all registers every protocol layer on import, which takes about a
+# second; captures handled by dpkt never touch it
+scapy = _lazy_import("scapy.all")
+
+# IPv4 protocol numbers counted by name; anything else is "Others"
+_IP_PROTOCOLS = {1: "ICMP", 6: "TCP", 17: "UDP"}
+
+# Source and destination addresses of an IPv4 header, as 32-bit ints
+_IPV4_ADDRESSES = struct.Struct(">II")
+
+
+def _top_counts(counts: dict, limit: int = 5) -> list:
+    """
+    Return the (key, count) pairs with the highest counts, highest first.
+
+    Ties keep first-seen order, matching Counter.most_common.
+
+    Parameters:
+        counts (dict): Mapping of key to count.
+        limit (int, optional): Number of entries to return.
+
+    Returns:
+        list: Up to limit (key, count) tuples.
+    """
+    return heapq.nlargest(limit, counts.items(), key=itemgetter(1))
+
+
+def _port_bytes(port: int) -> bytes:
+    """
+    Return a port number as it appears in a TCP or UDP header.
+
+    Parameters:
+        port (int): Port number filter.
+
+    Returns:
+        bytes: The big-endian 2-byte port, or b"\\x00" (which never
+        equals a 2-byte header field) if no header can carry the value.
+    """
+    try:
+        return port.to_bytes(2, "big")
+    except (AttributeError, OverflowError):
+        return b"\x00"
+
+
+def _count_dpkt_records(
+    records,
+    src_packed: bytes,
+    dst_packed: bytes,
+    src_port: int,
+    dst_port: int
+) -> tuple:
+    """
+    Count Ethernet frames that match the filters.
+
+    Parameters:
+        records (iterable): Raw Ethernet frames as bytes.
+        src_packed (bytes): Packed source IP address filter, if any.
+        dst_packed (bytes): Packed destination IP address filter, if any.
+        src_port (int): Source port number filter, if any.
+        dst_port (int): Destination port number filter, if any.
+
+    Returns:
+        tuple: Total packet count and the protocol, source IP and
+        destination IP count dicts, keyed by name and 32-bit address.
+    """
+    # Plain int dicts: increments avoid Counter's Python-level overhead
+    protocol_counts = defaultdict(int)
+    src_ip_counter = defaultdict(int)
+    dst_ip_counter = defaultdict(int)
+    total_packets = 0
+
+    ethernet_cls, ip_cls = dpkt.ethernet.Ethernet, dpkt.ip.IP
+    ports_classes = (dpkt.tcp.TCP, dpkt.udp.UDP)
+    protocol_names = _IP_PROTOCOLS
+    unpack_addresses = _IPV4_ADDRESSES.unpack_from
+
+    # Like a compiled "host"/"port" BPF program, reject untagged IPv4
+    # frames on the raw header bytes before dpkt decodes anything. These
+    # checks only ever reject frames the decoded checks below would too.
+    address_filter = bool(src_packed or dst_packed)
+    port_filter = bool(src_port or dst_port)
+    src_port_bytes = src_port and _port_bytes(src_port)
+    dst_port_bytes = dst_port and _port_bytes(dst_port)
+    ipv4_type = b"\x08\x00"
+    ports_protocols = (b"\x06", b"\x11")
+
+    for buf in records:
+        if buf[12:14] == ipv4_type:
+            if address_filter:
+                if src_packed and buf[26:30] != src_packed:
+                    continue
+                if dst_packed and buf[30:34] != dst_packed:
+                    continue
+            if port_filter:
+                if buf[23:24] not in ports_protocols:
+                    continue
+                # Ports follow the variable-length IP header
+                ports = 14 + (buf[14] & 0x0F) * 4
+                if src_port_bytes and buf[ports:ports + 2] != src_port_bytes:
+                    continue
+                if dst_port_bytes and (
+                    buf[ports + 2:ports + 4] != dst_port_bytes
+                ):
+                    continue
+            elif len(buf) >= 34 and buf[14] & 0x0F >= 5:
+                # dpkt always decodes these frames to an IP layer, so
+                # without port filters the header fields are read directly
+                src, dst = unpack_addresses(buf, 26)
+                total_packets += 1
+                protocol_counts[protocol_names.get(buf[23], "Others")] += 1
+                src_ip_counter[src] += 1
+                dst_ip_counter[dst] += 1
+                continue
+        try:
+            ip_layer = ethernet_cls(buf).data
+        except dpkt.UnpackError:
+            continue
+        if not isinstance(ip_layer, ip_cls):
+            continue
+
+        src, dst = ip_layer.src, ip_layer.dst
+        if src_packed and src != src_packed:
+            continue
+        if dst_packed and dst != dst_packed:
+            continue
+
+        if src_port or dst_port:
+            # Port filters only match decoded TCP and UDP headers
+            ports_layer = ip_layer.data
+            if not isinstance(ports_layer, ports_classes):
+                continue
+            if src_port and ports_layer.sport != src_port:
+                continue
+            if dst_port and ports_layer.dport != dst_port:
+                continue
+
+        total_packets += 1
+        protocol = protocol_names.get(ip_layer.p, "Others")
+        protocol_counts[protocol] += 1
+        # Counters are keyed by the addresses as ints, which hash to
+        # themselves; only the reported top entries become strings
+        src_ip_counter[int.from_bytes(src, "big")] += 1
+        dst_ip_counter[int.from_bytes(dst, "big")] += 1
+
+    return total_packets, protocol_counts, src_ip_counter, dst_ip_counter
+
+
+def _record_layout(pcap_file) -> tuple:
+    """
+    Read the record header layout of a classic pcap file.
+
+    Parameters:
+        pcap_file (file): Binary pcap file object.
+
+    Returns:
+        tuple: struct format of the caplen field and the record header
+        length.
+    """
+    position = pcap_file.tell()
+    pcap_file.seek(0)
+    header = dpkt.pcap.FileHdr(pcap_file.read(dpkt.pcap.FileHdr.__hdr_len__))
+    pcap_file.seek(position)
+    record_header = dpkt.pcap.MAGIC_TO_PKT_HDR[header.magic]
+    return record_header.__byte_order__ + "I", record_header.__hdr_len__
+
+
+def _pcap_records(data, layout: tuple, start: int, end: int):
+    """
+    Yield the raw frames of the pcap records in a byte range.
+
+    Parameters:
+        data (mmap.mmap): Memory-mapped pcap file.
+        layout (tuple): Record header layout from _record_layout.
+        start (int): Offset of the first record in the range.
+        end (int): Offset just past the last record in the range.
+
+    Yields:
+        bytes: Captured frame of each record, in file order.
+    """
+    caplen_format, header_len = layout
+    unpack_caplen = struct.Struct(caplen_format).unpack_from
+    pos = start
+    # Only the caplen field of each record header is decoded. A capture
+    # cut off inside a record header, as when tcpdump is killed, ends
+    # before that header, like Scapy's reader
+    while pos + header_len <= end:
+        caplen = unpack_caplen(data, pos + 8)[0]
+        pos += header_len
+        yield data[pos:pos + caplen]
+        pos += caplen
+
+
+def _split_pcap(data, layout: tuple, parts: int) -> list:
+    """
+    Split a classic pcap file into byte ranges on record boundaries.
+
+    Parameters:
+        data (mmap.mmap): Memory-mapped pcap file.
+        layout (tuple): Record header layout from _record_layout.
+        parts (int): Number of ranges wanted.
+
+    Returns:
+        list: (start, end) offsets of up to parts contiguous record
+        ranges.
+    """
+    caplen = struct.Struct(layout[0])
+    header_len = layout[1]
+
+    # Hop from record header to record header; only the caplen field of
+    # each header is read, none of the packet data
+    size = len(data)
+    start = pos = dpkt.pcap.FileHdr.__hdr_len__
+    bounds = [start]
+    for part in range(1, parts):
+        target = size * part // parts
+        while pos < target and pos + header_len <= size:
+            pos += header_len + caplen.unpack_from(data, pos + 8)[0]
+        if pos >= size:
+            break
+        if pos > bounds[-1]:
+            bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def _count_dpkt_range(
+    pcap_path: str,
+    layout: tuple,
+    start: int,
+    end: int,
+    filters: tuple
+) -> tuple:
+    """
+    Process pool entry point counting one byte range of a pcap file.
+
+    Parameters:
+        pcap_path (str): Path to the pcap file.
+        layout (tuple): Record header layout from _record_layout.
+        start (int): Offset of the first record in the range.
+        end (int): Offset just past the last record in the range.
+        filters (tuple): Arguments passed on to _count_dpkt_records.
+
+    Returns:
+        tuple: The counts returned by _count_dpkt_records.
+    """
+    with open(pcap_path, "rb") as pcap_file, mmap.mmap(
+        pcap_file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as data:
+        return _count_dpkt_records(
+            _pcap_records(data, layout, start, end), *filters
+        )
+
+
+def _count_dpkt_ranges(
+    pcap_path: str,
+    layout: tuple,
+    ranges: list,
+    filters: tuple
+) -> tuple:
+    """
+    Count pcap byte ranges in worker processes and merge the results.
+
+    Parameters:
+        pcap_path (str): Path to the pcap file.
+        layout (tuple): Record header layout from _record_layout.
+        ranges (list): (start, end) offsets from _split_pcap.
+        filters (tuple): Arguments passed on to _count_dpkt_records.
+
+    Returns:
+        tuple: The merged counts, in the form of _count_dpkt_records.
+    """
+    total_packets = 0
+    merged = (defaultdict(int), defaultdict(int), defaultdict(int))
+
+    with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+        partials = executor.map(
+            _count_dpkt_range,
+            repeat(pcap_path),
+            repeat(layout),
+            [start for start, _ in ranges],
+            [end for _, end in ranges],
+            repeat(filters),
+        )
+        # Ranges are merged in file order so keys keep their first-seen
+        # order and top-count ties resolve as in a single pass
+        for partial_total, *partial_counts in partials:
+            total_packets += partial_total
+            for counts, partial in zip(merged, partial_counts):
+                for key, count in partial.items():
+                    counts[key] += count
+
+    return (total_packets, *merged)
 
 
 class PacketAnalyzer:
@@ -13,21 +346,25 @@ class PacketAnalyzer:
     statistics such as protocol counts and top IP addresses.
     """
 
-    def __init__(self, pcap_path: str) -> None:
+    def __init__(self, pcap_path: str, use_scapy: bool = False) -> None:
         """
         Initialize the analyzer with the path to a pcap file.
 
         Parameters:
             pcap_path (str): Path to the pcap file.
+            use_scapy (bool, optional): Always dissect packets with Scapy,
+                even when dpkt is installed.
         """
         self.pcap_path = pcap_path
+        self.use_scapy = use_scapy
 
     def analyze(
         self,
         src_ip: str = None,
         dst_ip: str = None,
         src_port: int = None,
-        dst_port: int = None
+        dst_port: int = None,
+        workers: int = 1
     ) -> dict:
         """
         Analyze packets from the pcap file based on given filters.
@@ -37,12 +374,32 @@ class PacketAnalyzer:
             dst_ip (str, optional): Destination IP address to filter.
             src_port (int, optional): Source port number to filter.
             dst_port (int, optional): Destination port number to filter.
+            workers (int, optional): Number of processes that share the
+                dpkt read path, each counting a contiguous slice of the
+                capture. The Scapy path always runs in this process.
 
         Returns:
             dict: A dictionary containing packet statistics.
+
+        Raises:
+            ValueError: If workers is not a positive integer.
         """
+        if (not isinstance(workers, int) or isinstance(workers, bool)
+                or workers < 1):
+            raise ValueError(f"Invalid number of workers: {workers!r}")
+
+        # dpkt only decodes the few header fields needed here, which is far
+        # cheaper than building Scapy packet objects; captures it cannot
+        # read (pcapng, non-Ethernet link types) still go through Scapy.
+        if dpkt is not None and not self.use_scapy:
+            result = self._analyze_with_dpkt(
+                src_ip, dst_ip, src_port, dst_port, workers
+            )
+            if result is not None:
+                return result
+
         try:
-            packets = scapy.rdpcap(self.pcap_path)
+            reader = scapy.PcapReader(self.pcap_path)
         except FileNotFoundError as e:
             raise FileNotFoundError(
                 f"The file {self.pcap_path} was not found."
@@ -52,104 +409,167 @@ class PacketAnalyzer:
                 f"Error reading the pcap file: {e}"
             ) from e
 
-        # Validate IP addresses, if provided
-        if src_ip:
-            self._validate_ip(src_ip, "source")
-        if dst_ip:
-            self._validate_ip(dst_ip, "destination")
-
-        protocol_counts = Counter()
-        src_ip_counter = Counter()
-        dst_ip_counter = Counter()
+        # Plain int dicts: increments avoid Counter's Python-level overhead
+        protocol_counts = defaultdict(int)
+        src_ip_counter = defaultdict(int)
+        dst_ip_counter = defaultdict(int)
         total_packets = 0
 
-        for packet in packets:
-            if not self._packet_matches(
-                packet, src_ip, dst_ip, src_port, dst_port
-            ):
-                continue
+        # Stream packets instead of loading the whole capture into memory
+        with reader as packets:
+            # Validate IP addresses, if provided
+            if src_ip:
+                self._validate_ip(src_ip, "source")
+            if dst_ip:
+                self._validate_ip(dst_ip, "destination")
 
-            if not packet.haslayer(scapy.IP):
-                continue
+            ip_cls, tcp_cls, udp_cls = scapy.IP, scapy.TCP, scapy.UDP
+            protocol_names = _IP_PROTOCOLS
 
-            total_packets += 1
-            ip_layer = packet[scapy.IP]
+            try:
+                for packet in packets:
+                    # Look the IP layer up once; its fields serve both the
+                    # filters and the counts
+                    ip_layer = packet.getlayer(ip_cls)
+                    if ip_layer is None:
+                        continue
+                    if src_ip and ip_layer.src != src_ip:
+                        continue
+                    if dst_ip and ip_layer.dst != dst_ip:
+                        continue
 
-            if packet.haslayer(scapy.TCP):
-                protocol_counts["TCP"] += 1
-            elif packet.haslayer(scapy.UDP):
-                protocol_counts["UDP"] += 1
-            elif packet.haslayer(scapy.ICMP):
-                protocol_counts["ICMP"] += 1
-            else:
-                protocol_counts["Others"] += 1
+                    if src_port or dst_port:
+                        # Port filters only match TCP and UDP packets
+                        ports_layer = packet.getlayer(tcp_cls)
+                        if ports_layer is None:
+                            ports_layer = packet.getlayer(udp_cls)
+                            if ports_layer is None:
+                                continue
+                        if src_port and ports_layer.sport != src_port:
+                            continue
+                        if dst_port and ports_layer.dport != dst_port:
+                            continue
 
-            src_ip_counter[ip_layer.src] += 1
-            dst_ip_counter[ip_layer.dst] += 1
+                    # The IP header's protocol number names the payload
+                    # without walking the layer chain again, as in dpkt
+                    total_packets += 1
+                    protocol = protocol_names.get(ip_layer.proto, "Others")
+                    protocol_counts[protocol] += 1
+                    src_ip_counter[ip_layer.src] += 1
+                    dst_ip_counter[ip_layer.dst] += 1
+            except Exception as e:
+                raise OSError(
+                    f"Error reading the pcap file: {e}"
+                ) from e
 
         result = {
             "total_packets": total_packets,
             "protocol_counts": dict(protocol_counts),
-            "top_source_ips": src_ip_counter.most_common(5),
-            "top_destination_ips": dst_ip_counter.most_common(5)
+            "top_source_ips": _top_counts(src_ip_counter),
+            "top_destination_ips": _top_counts(dst_ip_counter)
         }
 
         return result
 
-    def _packet_matches(
+    def _analyze_with_dpkt(
         self,
-        packet,
         src_ip: str,
         dst_ip: str,
         src_port: int,
-        dst_port: int
-    ) -> bool:
+        dst_port: int,
+        workers: int = 1
+    ) -> dict:
         """
-        Check if a packet matches the specified IP and port filters.
+        Analyze an Ethernet pcap file with dpkt.
 
         Parameters:
-            packet: Scapy packet object.
             src_ip (str): Source IP address filter.
             dst_ip (str): Destination IP address filter.
             src_port (int): Source port number filter.
             dst_port (int): Destination port number filter.
+            workers (int, optional): Number of worker processes.
 
         Returns:
-            bool: True if the packet matches all filters, else False.
+            dict: Packet statistics, or None if the file is not a classic
+            Ethernet pcap that dpkt can read.
         """
-        if src_ip:
-            if not packet.haslayer(scapy.IP):
-                return False
-            if packet[scapy.IP].src != src_ip:
-                return False
-
-        if dst_ip:
-            if not packet.haslayer(scapy.IP):
-                return False
-            if packet[scapy.IP].dst != dst_ip:
-                return False
-
-        if src_port:
-            if packet.haslayer(scapy.TCP):
-                if packet[scapy.TCP].sport != src_port:
-                    return False
-            elif packet.haslayer(scapy.UDP):
-                if packet[scapy.UDP].sport != src_port:
-                    return False
-            else:
-                return False
-
-        if dst_port:
-            if packet.haslayer(scapy.TCP):
-                if packet[scapy.TCP].dport != dst_port:
-                    return False
-            elif packet.haslayer(scapy.UDP):
-                if packet[scapy.UDP].dport != dst_port:
-                    return False
-            else:
-                return False
-
-        return True
+        try:
+            pcap_file = open(self.pcap_path, "rb")
+        except FileNotFoundError as e:
+            raise FileNotFoundError(
+                f"The file {self.pcap_path} was not found."
+            ) from e
+        except Exception as e:
+            raise OSError(
+                f"Error reading the pcap file: {e}"
+            ) from e
+
+        with pcap_file:
+            try:
+                reader = dpkt.pcap.Reader(pcap_file)
+            except (ValueError, dpkt.UnpackError):
+                return None
+            if reader.datalink() != dpkt.pcap.DLT_EN10MB:
+                return None
+
+            # Validate IP addresses, if provided
+            if src_ip:
+                self._validate_ip(src_ip, "source")
+            if dst_ip:
+                self._validate_ip(dst_ip, "destination")
+
+            # Compare addresses in their packed form, as stored in the header
+            filters = (
+                src_ip and ipaddress.ip_address(src_ip).packed,
+                dst_ip and ipaddress.ip_address(dst_ip).packed,
+                src_port,
+                dst_port,
+            )
+
+            try:
+                layout = _record_layout(pcap_file)
+                # Records are sliced straight out of the page cache
+                # instead of being read through buffered file IO
+                with mmap.mmap(
+                    pcap_file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as data:
+                    ranges = ()
+                    if workers > 1:
+                        ranges = _split_pcap(data, layout, workers)
+                    if len(ranges) < 2:
+                        counts = _count_dpkt_records(
+                            _pcap_records(
+                                data,
+                                layout,
+                                dpkt.pcap.FileHdr.__hdr_len__,
+                                len(data),
+                            ),
+                            *filters
+                        )
+                    else:
+                        counts = _count_dpkt_ranges(
+                            self.pcap_path, layout, ranges, filters
+                        )
+            except Exception as e:
+                raise OSError(
+                    f"Error reading the pcap file: {e}"
+                ) from e
+
+        total_packets, protocol_counts, src_ip_counter, dst_ip_counter = counts
+        result = {
+            "total_packets": total_packets,
+            "protocol_counts": dict(protocol_counts),
+            "top_source_ips": [
+                (socket.inet_ntoa(ip.to_bytes(4, "big")), count)
+                for ip, count in _top_counts(src_ip_counter)
+            ],
+            "top_destination_ips": [
+                (socket.inet_ntoa(ip.to_bytes(4, "big")), count)
+                for ip, count in _top_counts(dst_ip_counter)
+            ]
+        }
+
+        return result
 
     def _validate_ip(self, ip_str: str, label: str) -> None:
         """
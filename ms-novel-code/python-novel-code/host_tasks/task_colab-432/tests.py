@@ -2,10 +2,31 @@
 
 """Unit tests for PacketAnalyzer class."""
 
+import os
+import socket
+import subprocess
+import sys
+import tempfile
 import unittest
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 from main import PacketAnalyzer
 
+try:
+    import dpkt
+except ImportError:
+    dpkt = None
+
+
+class FakePacket:
+    """Lightweight packet double; far cheaper to build than a MagicMock."""
+
+    __slots__ = ("getlayer",)
+
+    def __init__(self, layers):
+        """Serve getlayer() lookups from the given layer mapping."""
+        self.getlayer = layers.get
+
 
 class TestPacketAnalyzer(unittest.TestCase):
     """Test cases for PacketAnalyzer class."""
@@ -13,7 +34,7 @@ class TestPacketAnalyzer(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.valid_pcap_path = "test_traffic.pcap"
-        self.analyzer = PacketAnalyzer(self.valid_pcap_path)
+        self.analyzer = PacketAnalyzer(self.valid_pcap_path, use_scapy=True)
 
     def test_init_valid_path(self):
         """Test initialization with valid pcap path."""
@@ -25,30 +46,48 @@ class TestPacketAnalyzer(unittest.TestCase):
         analyzer = PacketAnalyzer("")
         self.assertEqual(analyzer.pcap_path, "")
 
-    @patch('main.scapy.rdpcap')
-    def test_analyze_file_not_found(self, mock_rdpcap):
+    def test_import_keeps_scapy_all_reachable(self):
+        """Test importing main leaves scapy.all usable as a submodule."""
+        # A fresh interpreter, so scapy.all is first imported by main
+        code = "import main, scapy.all; scapy.all.IP"
+        completed = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+        )
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+
+    def test_analyze_invalid_workers(self):
+        """Test analyze rejects a worker count that is not a positive int."""
+        for workers in ("2", 1.5, 0, -1, True):
+            with self.assertRaises(ValueError):
+                PacketAnalyzer(self.valid_pcap_path).analyze(workers=workers)
+
+    @patch('main.scapy.PcapReader')
+    def test_analyze_file_not_found(self, mock_reader):
         """Test analyze method with non-existent pcap file."""
-        mock_rdpcap.side_effect = FileNotFoundError("File not found")
+        mock_reader.side_effect = FileNotFoundError("File not found")
 
         with self.assertRaises(FileNotFoundError) as context:
             self.analyzer.analyze()
 
         self.assertIn("was not found", str(context.exception))
 
-    @patch('main.scapy.rdpcap')
-    def test_analyze_file_read_error(self, mock_rdpcap):
+    @patch('main.scapy.PcapReader')
+    def test_analyze_file_read_error(self, mock_reader):
         """Test analyze method with file read error."""
-        mock_rdpcap.side_effect = Exception("Read error")
+        mock_reader.side_effect = Exception("Read error")
 
         with self.assertRaises(OSError) as context:
             self.analyzer.analyze()
 
         self.assertIn("Error reading the pcap file", str(context.exception))
 
-    @patch('main.scapy.rdpcap')
-    def test_analyze_empty_pcap_file(self, mock_rdpcap):
+    @patch('main.scapy.PcapReader')
+    def test_analyze_empty_pcap_file(self, mock_reader):
         """Test analyze with empty pcap file."""
-        mock_rdpcap.return_value = []
+        mock_reader.return_value.__enter__.return_value = []
 
         result = self.analyzer.analyze()
 
@@ -60,12 +99,11 @@ class TestPacketAnalyzer(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
-    @patch('main.scapy.rdpcap')
-    def test_analyze_no_ip_layer_packets(self, mock_rdpcap):
+    @patch('main.scapy.PcapReader')
+    def test_analyze_no_ip_layer_packets(self, mock_reader):
         """Test analyze with packets having no IP layer."""
-        mock_packet = MagicMock()
-        mock_packet.haslayer.return_value = False
-        mock_rdpcap.return_value = [mock_packet]
+        mock_packet = FakePacket({})
+        mock_reader.return_value.__enter__.return_value = [mock_packet]
 
         result = self.analyzer.analyze()
 
@@ -77,18 +115,16 @@ class TestPacketAnalyzer(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
-    @patch('main.scapy.rdpcap')
+    @patch('main.scapy.PcapReader')
     @patch('main.scapy.IP')
     @patch('main.scapy.TCP')
-    def test_analyze_tcp_packets(self, mock_tcp, mock_ip, mock_rdpcap):
+    def test_analyze_tcp_packets(self, mock_tcp, mock_ip, mock_reader):
         """Test analyze with TCP packets."""
-        mock_packet = MagicMock()
-        mock_packet.haslayer.side_effect = lambda layer: layer in [
-            mock_ip, mock_tcp
-        ]
-        mock_packet.__getitem__.return_value.src = "192.168.1.1"
-        mock_packet.__getitem__.return_value.dst = "192.168.1.2"
-        mock_rdpcap.return_value = [mock_packet]
+        mock_packet = FakePacket({
+            mock_ip: MagicMock(src="192.168.1.1", dst="192.168.1.2", proto=6),
+            mock_tcp: MagicMock(),
+        })
+        mock_reader.return_value.__enter__.return_value = [mock_packet]
 
         result = self.analyzer.analyze()
 
@@ -97,51 +133,46 @@ class TestPacketAnalyzer(unittest.TestCase):
         self.assertEqual(result["top_source_ips"][0], ("192.168.1.1", 1))
         self.assertEqual(result["top_destination_ips"][0], ("192.168.1.2", 1))
 
-    @patch('main.scapy.rdpcap')
+    @patch('main.scapy.PcapReader')
     @patch('main.scapy.IP')
     @patch('main.scapy.UDP')
-    def test_analyze_udp_packets(self, mock_udp, mock_ip, mock_rdpcap):
+    def test_analyze_udp_packets(self, mock_udp, mock_ip, mock_reader):
         """Test analyze with UDP packets."""
-        mock_packet = MagicMock()
-        mock_packet.haslayer.side_effect = lambda layer: layer in [
-            mock_ip, mock_udp
-        ]
-        mock_packet.__getitem__.return_value.src = "10.0.0.1"
-        mock_packet.__getitem__.return_value.dst = "10.0.0.2"
-        mock_rdpcap.return_value = [mock_packet]
+        mock_packet = FakePacket({
+            mock_ip: MagicMock(src="10.0.0.1", dst="10.0.0.2", proto=17),
+            mock_udp: MagicMock(),
+        })
+        mock_reader.return_value.__enter__.return_value = [mock_packet]
 
         result = self.analyzer.analyze()
 
         self.assertEqual(result["total_packets"], 1)
         self.assertEqual(result["protocol_counts"]["UDP"], 1)
 
-    @patch('main.scapy.rdpcap')
+    @patch('main.scapy.PcapReader')
     @patch('main.scapy.IP')
     @patch('main.scapy.ICMP')
-    def test_analyze_icmp_packets(self, mock_icmp, mock_ip, mock_rdpcap):
+    def test_analyze_icmp_packets(self, mock_icmp, mock_ip, mock_reader):
         """Test analyze with ICMP packets."""
-        mock_packet = MagicMock()
-        mock_packet.haslayer.side_effect = lambda layer: layer in [
-            mock_ip, mock_icmp
-        ]
-        mock_packet.__getitem__.return_value.src = "8.8.8.8"
-        mock_packet.__getitem__.return_value.dst = "192.168.1.1"
-        mock_rdpcap.return_value = [mock_packet]
+        mock_packet = FakePacket({
+            mock_ip: MagicMock(src="8.8.8.8", dst="192.168.1.1", proto=1),
+            mock_icmp: MagicMock(),
+        })
+        mock_reader.return_value.__enter__.return_value = [mock_packet]
 
         result = self.analyzer.analyze()
 
         self.assertEqual(result["total_packets"], 1)
         self.assertEqual(result["protocol_counts"]["ICMP"], 1)
 
-    @patch('main.scapy.rdpcap')
+    @patch('main.scapy.PcapReader')
     @patch('main.scapy.IP')
-    def test_analyze_other_protocol_packets(self, mock_ip, mock_rdpcap):
+    def test_analyze_other_protocol_packets(self, mock_ip, mock_reader):
         """Test analyze with other protocol packets."""
-        mock_packet = MagicMock()
-        mock_packet.haslayer.side_effect = lambda layer: layer == mock_ip
-        mock_packet.__getitem__.return_value.src = "172.16.0.1"
-        mock_packet.__getitem__.return_value.dst = "172.16.0.2"
-        mock_rdpcap.return_value = [mock_packet]
+        mock_packet = FakePacket({
+            mock_ip: MagicMock(src="172.16.0.1", dst="172.16.0.2"),
+        })
+        mock_reader.return_value.__enter__.return_value = [mock_packet]
 
         result = self.analyzer.analyze()
 
@@ -167,134 +198,114 @@ class TestPacketAnalyzer(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.analyzer._validate_ip("not.an.ip", "test")
 
-    @patch('main.scapy.rdpcap')
-    def test_analyze_with_invalid_src_ip(self, mock_rdpcap):
+    @patch('main.scapy.PcapReader')
+    def test_analyze_with_invalid_src_ip(self, mock_reader):
         """Test analyze with invalid source IP filter."""
-        mock_rdpcap.return_value = []
+        mock_reader.return_value.__enter__.return_value = []
 
         with self.assertRaises(ValueError) as context:
             self.analyzer.analyze(src_ip="invalid.ip")
         self.assertIn("Invalid source IP address", str(context.exception))
 
-    @patch('main.scapy.rdpcap')
-    def test_analyze_with_invalid_dst_ip(self, mock_rdpcap):
+    @patch('main.scapy.PcapReader')
+    def test_analyze_with_invalid_dst_ip(self, mock_reader):
         """Test analyze with invalid destination IP filter."""
-        mock_rdpcap.return_value = []
+        mock_reader.return_value.__enter__.return_value = []
 
         with self.assertRaises(ValueError) as context:
             self.analyzer.analyze(dst_ip="999.999.999.999")
         self.assertIn("Invalid destination IP address",
                       str(context.exception))
 
-    @patch('main.scapy.rdpcap')
+    @patch('main.scapy.PcapReader')
     @patch('main.scapy.IP')
     @patch('main.scapy.TCP')
     def test_packet_matches_src_ip_filter(self, mock_tcp, mock_ip,
-                                          mock_rdpcap):
+                                          mock_reader):
         """Test packet filtering by source IP."""
-        mock_packet = MagicMock()
-        mock_packet.haslayer.side_effect = lambda layer: layer in [
-            mock_ip, mock_tcp
-        ]
-        mock_packet.__getitem__.return_value.src = "192.168.1.1"
-        mock_packet.__getitem__.return_value.dst = "192.168.1.2"
-        mock_rdpcap.return_value = [mock_packet]
+        mock_packet = FakePacket({
+            mock_ip: MagicMock(src="192.168.1.1", dst="192.168.1.2", proto=6),
+            mock_tcp: MagicMock(),
+        })
+        mock_reader.return_value.__enter__.return_value = [mock_packet]
 
         result = self.analyzer.analyze(src_ip="192.168.1.1")
 
         self.assertEqual(result["total_packets"], 1)
 
-    @patch('main.scapy.rdpcap')
+    @patch('main.scapy.PcapReader')
     @patch('main.scapy.IP')
     @patch('main.scapy.TCP')
     def test_packet_matches_dst_ip_filter(self, mock_tcp, mock_ip,
-                                          mock_rdpcap):
+                                          mock_reader):
         """Test packet filtering by destination IP."""
-        mock_packet = MagicMock()
-        mock_packet.haslayer.side_effect = lambda layer: layer in [
-            mock_ip, mock_tcp
-        ]
-        mock_packet.__getitem__.return_value.src = "192.168.1.1"
-        mock_packet.__getitem__.return_value.dst = "192.168.1.2"
-        mock_rdpcap.return_value = [mock_packet]
+        mock_packet = FakePacket({
+            mock_ip: MagicMock(src="192.168.1.1", dst="192.168.1.2", proto=6),
+            mock_tcp: MagicMock(),
+        })
+        mock_reader.return_value.__enter__.return_value = [mock_packet]
 
         result = self.analyzer.analyze(dst_ip="192.168.1.2")
 
         self.assertEqual(result["total_packets"], 1)
 
-    @patch('main.scapy.rdpcap')
+    @patch('main.scapy.PcapReader')
     @patch('main.scapy.IP')
     @patch('main.scapy.TCP')
     def test_packet_matches_src_port_tcp_filter(self, mock_tcp, mock_ip,
-                                                mock_rdpcap):
+                                                mock_reader):
         """Test packet filtering by TCP source port."""
-        mock_packet = MagicMock()
-        mock_packet.haslayer.side_effect = lambda layer: layer in [
-            mock_ip, mock_tcp
-        ]
-        mock_packet.__getitem__.side_effect = lambda layer: (
-            MagicMock(src="192.168.1.1", dst="192.168.1.2")
-            if layer == mock_ip
-            else MagicMock(sport=80, dport=443)
-        )
-        mock_rdpcap.return_value = [mock_packet]
+        mock_packet = FakePacket({
+            mock_ip: MagicMock(src="192.168.1.1", dst="192.168.1.2", proto=6),
+            mock_tcp: MagicMock(sport=80, dport=443),
+        })
+        mock_reader.return_value.__enter__.return_value = [mock_packet]
 
         result = self.analyzer.analyze(src_port=80)
 
         self.assertEqual(result["total_packets"], 1)
 
-    @patch('main.scapy.rdpcap')
+    @patch('main.scapy.PcapReader')
     @patch('main.scapy.IP')
     @patch('main.scapy.UDP')
     def test_packet_matches_dst_port_udp_filter(self, mock_udp, mock_ip,
-                                                mock_rdpcap):
+                                                mock_reader):
         """Test packet filtering by UDP destination port."""
-        mock_packet = MagicMock()
-        mock_packet.haslayer.side_effect = lambda layer: layer in [
-            mock_ip, mock_udp
-        ]
-        mock_packet.__getitem__.side_effect = lambda layer: (
-            MagicMock(src="10.0.0.1", dst="10.0.0.2")
-            if layer == mock_ip
-            else MagicMock(sport=53, dport=53)
-        )
-        mock_rdpcap.return_value = [mock_packet]
+        mock_packet = FakePacket({
+            mock_ip: MagicMock(src="10.0.0.1", dst="10.0.0.2", proto=17),
+            mock_udp: MagicMock(sport=53, dport=53),
+        })
+        mock_reader.return_value.__enter__.return_value = [mock_packet]
 
         result = self.analyzer.analyze(dst_port=53)
 
         self.assertEqual(result["total_packets"], 1)
 
-    @patch('main.scapy.rdpcap')
+    @patch('main.scapy.PcapReader')
     @patch('main.scapy.IP')
     def test_packet_no_match_port_filter_no_tcp_udp(self, mock_ip,
-                                                    mock_rdpcap):
+                                                    mock_reader):
         """Test port filter with non-TCP/UDP packets."""
-        mock_packet = MagicMock()
-        mock_packet.haslayer.side_effect = lambda layer: layer == mock_ip
-        mock_packet.__getitem__.return_value.src = "192.168.1.1"
-        mock_packet.__getitem__.return_value.dst = "192.168.1.2"
-        mock_rdpcap.return_value = [mock_packet]
+        mock_packet = FakePacket({
+            mock_ip: MagicMock(src="192.168.1.1", dst="192.168.1.2"),
+        })
+        mock_reader.return_value.__enter__.return_value = [mock_packet]
 
         result = self.analyzer.analyze(src_port=80)
 
         self.assertEqual(result["total_packets"], 0)
 
-    @patch('main.scapy.rdpcap')
+    @patch('main.scapy.PcapReader')
     @patch('main.scapy.IP')
     @patch('main.scapy.TCP')
     def test_analyze_multiple_filters_combined(self, mock_tcp, mock_ip,
-                                               mock_rdpcap):
+                                               mock_reader):
         """Test analyze with multiple filters combined."""
-        mock_packet = MagicMock()
-        mock_packet.haslayer.side_effect = lambda layer: layer in [
-            mock_ip, mock_tcp
-        ]
-        mock_packet.__getitem__.side_effect = lambda layer: (
-            MagicMock(src="192.168.1.100", dst="8.8.8.8")
-            if layer == mock_ip
-            else MagicMock(sport=12345, dport=80)
-        )
-        mock_rdpcap.return_value = [mock_packet]
+        mock_packet = FakePacket({
+            mock_ip: MagicMock(src="192.168.1.100", dst="8.8.8.8", proto=6),
+            mock_tcp: MagicMock(sport=12345, dport=80),
+        })
+        mock_reader.return_value.__enter__.return_value = [mock_packet]
 
         result = self.analyzer.analyze(
             src_ip="192.168.1.100",
@@ -305,19 +316,17 @@ class TestPacketAnalyzer(unittest.TestCase):
 
         self.assertEqual(result["total_packets"], 1)
 
-    @patch('main.scapy.rdpcap')
+    @patch('main.scapy.PcapReader')
     @patch('main.scapy.IP')
     @patch('main.scapy.TCP')
     def test_analyze_no_packets_match_filters(self, mock_tcp, mock_ip,
-                                              mock_rdpcap):
+                                              mock_reader):
         """Test analyze when no packets match the filters."""
-        mock_packet = MagicMock()
-        mock_packet.haslayer.side_effect = lambda layer: layer in [
-            mock_ip, mock_tcp
-        ]
-        mock_packet.__getitem__.return_value.src = "192.168.1.1"
-        mock_packet.__getitem__.return_value.dst = "192.168.1.2"
-        mock_rdpcap.return_value = [mock_packet]
+        mock_packet = FakePacket({
+            mock_ip: MagicMock(src="192.168.1.1", dst="192.168.1.2", proto=6),
+            mock_tcp: MagicMock(),
+        })
+        mock_reader.return_value.__enter__.return_value = [mock_packet]
 
         result = self.analyzer.analyze(src_ip="10.0.0.1")
 
@@ -329,10 +338,10 @@ class TestPacketAnalyzer(unittest.TestCase):
         }
         self.assertEqual(result, expected)
 
-    @patch('main.scapy.rdpcap')
+    @patch('main.scapy.PcapReader')
     @patch('main.scapy.IP')
     @patch('main.scapy.TCP')
-    def test_analyze_top_ips_ordering(self, mock_tcp, mock_ip, mock_rdpcap):
+    def test_analyze_top_ips_ordering(self, mock_tcp, mock_ip, mock_reader):
         """Test top IPs are correctly ordered by frequency."""
         packets = []
         ips = [
@@ -343,15 +352,13 @@ class TestPacketAnalyzer(unittest.TestCase):
 
         for src_ip, dst_ip, count in ips:
             for _ in range(count):
-                mock_packet = MagicMock()
-                mock_packet.haslayer.side_effect = lambda layer: layer in [
-                    mock_ip, mock_tcp
-                ]
-                mock_packet.__getitem__.return_value.src = src_ip
-                mock_packet.__getitem__.return_value.dst = dst_ip
+                mock_packet = FakePacket({
+                    mock_ip: SimpleNamespace(src=src_ip, dst=dst_ip, proto=6),
+                    mock_tcp: SimpleNamespace(),
+                })
                 packets.append(mock_packet)
 
-        mock_rdpcap.return_value = packets
+        mock_reader.return_value.__enter__.return_value = packets
 
         result = self.analyzer.analyze()
 
@@ -361,5 +368,82 @@ class TestPacketAnalyzer(unittest.TestCase):
         self.assertEqual(result["top_destination_ips"][0], ("8.8.4.4", 5))
 
 
+@unittest.skipIf(dpkt is None, "dpkt is not installed")
+class TestPacketAnalyzerDpkt(unittest.TestCase):
+    """Test cases for the dpkt read path against a real pcap file."""
+
+    def setUp(self):
+        """Write a small Ethernet pcap with TCP, UDP and ICMP packets."""
+        def frame(src, dst, l4, proto):
+            ip = dpkt.ip.IP(src=socket.inet_aton(src),
+                            dst=socket.inet_aton(dst), p=proto, data=l4)
+            return bytes(dpkt.ethernet.Ethernet(
+                type=dpkt.ethernet.ETH_TYPE_IP, data=ip))
+
+        frames = [
+            frame("10.0.0.1", "10.0.0.2",
+                  dpkt.tcp.TCP(sport=1234, dport=80), dpkt.ip.IP_PROTO_TCP),
+            frame("10.0.0.1", "10.0.0.3",
+                  dpkt.udp.UDP(sport=53, dport=53), dpkt.ip.IP_PROTO_UDP),
+            frame("10.0.0.4", "10.0.0.2",
+                  dpkt.icmp.ICMP(type=8, data=dpkt.icmp.ICMP.Echo(id=1)),
+                  dpkt.ip.IP_PROTO_ICMP),
+        ]
+        fd, self.pcap_path = tempfile.mkstemp(suffix=".pcap")
+        with os.fdopen(fd, "wb") as f:
+            writer = dpkt.pcap.Writer(f)
+            for ts, buf in enumerate(frames):
+                writer.writepkt(buf, ts)
+
+    def tearDown(self):
+        """Remove the temporary pcap file."""
+        os.remove(self.pcap_path)
+
+    def test_analyze_matches_scapy(self):
+        """Test the dpkt and Scapy read paths report the same statistics."""
+        for filters in ({}, {"src_ip": "10.0.0.1"}, {"dst_port": 80}):
+            fast = PacketAnalyzer(self.pcap_path).analyze(**filters)
+            slow = PacketAnalyzer(
+                self.pcap_path, use_scapy=True).analyze(**filters)
+            self.assertEqual(fast, slow)
+
+        result = PacketAnalyzer(self.pcap_path).analyze()
+        self.assertEqual(result["total_packets"], 3)
+        self.assertEqual(result["protocol_counts"],
+                         {"TCP": 1, "UDP": 1, "ICMP": 1})
+        self.assertEqual(result["top_source_ips"][0], ("10.0.0.1", 2))
+
+    def test_analyze_truncated_record_header(self):
+        """Test a capture cut off inside a record header is still read."""
+        with open(self.pcap_path, "ab") as f:
+            f.write(b"\x03\x00\x00\x00\x00\x00\x00")
+
+        fast = PacketAnalyzer(self.pcap_path).analyze()
+        slow = PacketAnalyzer(self.pcap_path, use_scapy=True).analyze()
+        self.assertEqual(fast, slow)
+        self.assertEqual(fast["total_packets"], 3)
+
+    def test_analyze_truncated_record_matches_scapy(self):
+        """Test a capture cut off inside a frame reads as Scapy reads it."""
+        with open(self.pcap_path, "rb") as f:
+            data = f.read()
+        with open(self.pcap_path, "ab") as f:
+            # A copy of the first record header and 20 bytes of its frame
+            f.write(data[24:60])
+
+        slow = PacketAnalyzer(self.pcap_path, use_scapy=True).analyze()
+        self.assertEqual(PacketAnalyzer(self.pcap_path).analyze(), slow)
+        self.assertEqual(
+            PacketAnalyzer(self.pcap_path).analyze(workers=2), slow)
+
+    def test_analyze_with_workers_matches_single_process(self):
+        """Test splitting the capture across workers gives equal results."""
+        for filters in ({}, {"src_ip": "10.0.0.1"}, {"dst_port": 80}):
+            single = PacketAnalyzer(self.pcap_path).analyze(**filters)
+            split = PacketAnalyzer(self.pcap_path).analyze(
+                workers=3, **filters)
+            self.assertEqual(single, split)
+
+
 if __name__ == "__main__":
     unittest.main()
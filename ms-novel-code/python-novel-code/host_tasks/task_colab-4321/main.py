@@ -1,5 +1,5 @@
 # code
-"""API Gateway Simulator using Python's http.server and socketserver.
+"""API Gateway Simulator using Python's http.server.
 
 This server simulates API gateway behavior:
 - Validates URI path and request body
@@ -9,10 +9,13 @@ This server simulates API gateway behavior:
 """
 
 import http.server
-import socketserver
 import json
+import os
 import re
-from urllib.parse import urlparse, parse_qs
+import socket
+import time
+from functools import lru_cache
+from urllib.parse import ParseResult, urlparse, parse_qs
 from datetime import datetime, timezone
 
 PORT = 8080
@@ -24,6 +27,42 @@ GATEWAY_CUSTOM_HEADERS = {
     "X-Trace-ID": "trace-12345",
 }
 
+# Compiled once instead of going through re's pattern cache per request
+_RESOURCE_RE = re.compile(r"/api/([a-zA-Z0-9]+)\Z")
+
+# (epoch second, formatted timestamp); swapped as one tuple so concurrent
+# handler threads never see a second paired with another second's text
+_timestamp_cache = (0, "")
+
+
+def _iso_now() -> str:
+    """Return the current UTC time as an ISO 8601 string ending in Z."""
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, text = _timestamp_cache
+    if second != cached_second:
+        text = (datetime.fromtimestamp(second, timezone.utc)
+                .isoformat(timespec="seconds")
+                .replace("+00:00", "Z"))
+        _timestamp_cache = (second, text)
+    return text
+
+
+@lru_cache(maxsize=64)
+def _error_body_prefix(
+    status_code: int, status_message: str, error_detail: str
+) -> bytes:
+    """Return the encoded JSON error body up to the timestamp value."""
+    response = {
+        "status": "error",
+        "code": status_code,
+        "message": status_message,
+        "details": error_detail,
+        "timestamp": "",
+    }
+    # Drop the closing '"}' so the timestamp can be appended per request
+    return json.dumps(response)[:-2].encode("utf-8")
+
 
 class APIGatewayHandler(http.server.BaseHTTPRequestHandler):
     """Handles HTTP requests as a simulated API Gateway."""
@@ -45,7 +84,7 @@ class APIGatewayHandler(http.server.BaseHTTPRequestHandler):
             self.send_error_response(404, "Not Found", "Invalid API path.")
             return
 
-        resource_match = re.match(r"/api/([a-zA-Z0-9]+)$", path)
+        resource_match = _RESOURCE_RE.match(path)
         if not resource_match:
             self.send_error_response(
                 404, "Not Found", "Invalid resource name in API path."
@@ -62,22 +101,18 @@ class APIGatewayHandler(http.server.BaseHTTPRequestHandler):
                     f"Request body exceeds {MAX_BODY_SIZE} bytes.",
                 )
                 return
+            # The body is parsed once, by the endpoint that consumes it
             try:
                 body = self.rfile.read(content_length)
-                json.loads(body)  # Validate JSON
-            except json.JSONDecodeError:
-                self.send_error_response(400,
-                                         "Bad Request", "Invalid JSON body.")
-                return
             except Exception:
                 self.send_error_response(
                     400, "Bad Request", "Error reading request body."
                 )
                 return
 
-        forward_headers = {k: v for k, v in self.headers.items()}
-
-        if len(forward_headers) + len(GATEWAY_CUSTOM_HEADERS) > MAX_HEADERS:
+        # Count the received header lines before copying any of them, so
+        # an oversized request is rejected without building its dict
+        if len(self.headers) + len(GATEWAY_CUSTOM_HEADERS) > MAX_HEADERS:
             self.send_error_response(
                 400,
                 "Bad Request",
@@ -85,16 +120,24 @@ class APIGatewayHandler(http.server.BaseHTTPRequestHandler):
             )
             return
 
+        forward_headers = dict(self.headers.items())
+
         try:
             (status_code, response_headers,
              response_body) = self.forward_request(
-                method, path, forward_headers, body
+                method, parsed_path, forward_headers, body
             )
             self.send_response(status_code)
             for header, value in response_headers.items():
                 self.send_header(header, value)
             self.end_headers()
             self.wfile.write(response_body)
+        except json.JSONDecodeError:
+            self.send_error_response(400, "Bad Request", "Invalid JSON body.")
+        except UnicodeDecodeError:
+            self.send_error_response(
+                400, "Bad Request", "Error reading request body."
+            )
         except Exception as e:
             print(f"Error during request forwarding: {e}")
             self.send_error_response(
@@ -102,10 +145,11 @@ class APIGatewayHandler(http.server.BaseHTTPRequestHandler):
             )
 
     def forward_request(
-        self, method: str, path: str, headers: dict, body: bytes
+        self, method: str, parsed_path: ParseResult, headers: dict,
+        body: bytes
     ) -> tuple[int, dict, bytes]:
         """Forward the request to a mock internal endpoint."""
-        rewritten_path = self.rewrite_uri(path)
+        rewritten_path = self.rewrite_uri(parsed_path)
         modified_headers = self.add_custom_headers(headers)
         (status_code, mock_response_headers,
          mock_response_body) = self.mock_endpoint(
@@ -115,53 +159,52 @@ class APIGatewayHandler(http.server.BaseHTTPRequestHandler):
                                   (mock_response_headers))
         return status_code, final_response_headers, mock_response_body
 
-    def rewrite_uri(self, path: str) -> str:
-        """Rewrite the incoming URI to an internal path."""
-        parsed_path = urlparse(path)
-        resource_name = parsed_path.path.split("/api/", 1)[1]
+    def rewrite_uri(self, parsed_path: ParseResult) -> str:
+        """Rewrite the already parsed incoming URI to an internal path."""
+        resource_name = parsed_path.path.partition("/api/")[2]
         new_path = f"/internal/{resource_name}"
         if parsed_path.query:
             new_path += f"?{parsed_path.query}"
         return new_path
 
     def add_custom_headers(self, headers: dict) -> dict:
-        """Add gateway-specific custom headers."""
-        new_headers = headers.copy()
-        new_headers.update(GATEWAY_CUSTOM_HEADERS)
-        return new_headers
+        """Add gateway-specific custom headers in place.
+
+        Both header dicts are built per request and owned by the gateway,
+        so they are updated directly rather than copied.
+        """
+        headers.update(GATEWAY_CUSTOM_HEADERS)
+        return headers
 
     def remove_custom_headers(self, headers: dict) -> dict:
-        """Remove gateway-injected headers from the response."""
-        final_headers = headers.copy()
+        """Remove gateway-injected headers from the response in place."""
         for header_name in GATEWAY_CUSTOM_HEADERS:
-            final_headers.pop(header_name, None)
-        return final_headers
+            headers.pop(header_name, None)
+        return headers
 
     def mock_endpoint(
         self, path: str, method: str, headers: dict, body: bytes
     ) -> tuple[int, dict, bytes]:
         """Simulate a mock internal endpoint and return dummy response."""
-        parsed_path = urlparse(path)
-        resource_name = parsed_path.path.split("/internal/", 1)[1]
-        query_params = parse_qs(parsed_path.query)
+        # The gateway builds this URI itself, so a partition on "?" is all
+        # the parsing it needs
+        internal_path, _, query = path.partition("?")
+        resource_name = internal_path.partition("/internal/")[2]
 
         response_payload = {
             "resource": resource_name,
             "status": "received",
-            "timestamp": datetime.now(timezone.utc)
-            .isoformat(timespec="seconds")
-            .replace("+00:00", "Z"),
+            "timestamp": _iso_now(),
         }
 
         if method == "GET":
-            for key, values in query_params.items():
-                response_payload[key] = values[0]
-        elif method == "POST" and body:
-            try:
-                request_data = json.loads(body)
-                response_payload.update(request_data)
-            except json.JSONDecodeError:
-                pass
+            # parse_qs still runs its full parser on an empty string
+            if query:
+                for key, values in parse_qs(query).items():
+                    response_payload[key] = values[0]
+        elif method == "POST":
+            # Parse errors propagate so the gateway can answer 400
+            response_payload.update(json.loads(body))
 
         mock_headers = {
             "Content-Type": "application/json",
@@ -169,13 +212,9 @@ class APIGatewayHandler(http.server.BaseHTTPRequestHandler):
             "X-Gateway-ID": "should-be-removed",
             "X-Trace-ID": "should-also-be-removed",
         }
-        mock_headers.update(
-            {
-                k: v
-                for k, v in headers.items()
-                if k.startswith("X-") and k not in GATEWAY_CUSTOM_HEADERS
-            }
-        )
+        for k, v in headers.items():
+            if k[:2] == "X-" and k not in GATEWAY_CUSTOM_HEADERS:
+                mock_headers[k] = v
 
         return 200, mock_headers, json.dumps(response_payload).encode("utf-8")
 
@@ -186,23 +225,49 @@ class APIGatewayHandler(http.server.BaseHTTPRequestHandler):
         self.send_response(status_code)
         self.send_header("Content-Type", "application/json")
         self.end_headers()
-        response = {
-            "status": "error",
-            "code": status_code,
-            "message": status_message,
-            "details": error_detail,
-            "timestamp": datetime.now(timezone.utc)
-            .isoformat(timespec="seconds")
-            .replace("+00:00", "Z"),
-        }
-        self.wfile.write(json.dumps(response).encode("utf-8"))
+        self.wfile.write(
+            _error_body_prefix(status_code, status_message, error_detail)
+            + _iso_now().encode("ascii") + b'"}'
+        )
+
+
+class _GatewayServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server tuned for many short gateway connections."""
+
+    request_queue_size = 256
+
+    def __init__(self, server_address, handler_class,
+                 reuse_port: bool = False) -> None:
+        self.reuse_port = reuse_port
+        super().__init__(server_address, handler_class)
+
+    def server_bind(self) -> None:
+        """Let the other forked worker processes bind the same port."""
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def finish_request(self, request, client_address) -> None:
+        """Disable Nagle so small JSON responses are sent immediately."""
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        super().finish_request(request, client_address)
+
 
+def run_server(workers: int = 1):
+    """Start the threaded HTTP server, optionally in several processes."""
+    # Each forked worker binds its own SO_REUSEPORT listener and the
+    # kernel spreads incoming connections across them; a single process
+    # binds a plain listener, so a second server on the port still fails
+    forking = (workers > 1 and hasattr(os, "fork")
+               and hasattr(socket, "SO_REUSEPORT"))
+    if forking:
+        for _ in range(workers - 1):
+            if os.fork() == 0:
+                break
 
-def run_server():
-    """Start the threaded HTTP server."""
-    with (socketserver.ThreadingTCPServer(("", PORT),
-                                          APIGatewayHandler) as httpd):
-        print(f"Serving on port {PORT}")
+    with _GatewayServer(("", PORT), APIGatewayHandler,
+                        reuse_port=forking) as httpd:
+        print(f"Serving on port {PORT} (pid {os.getpid()})")
         try:
             httpd.serve_forever()
         except KeyboardInterrupt:
@@ -1,21 +1,64 @@
 
 """
-Arbitrage detection system using reactive programming and marble diagrams.
+Arbitrage detection system over marble-diagram price streams.
 
 This module implements cryptocurrency arbitrage opportunity detection across
-multiple exchanges using reactive streams and marble diagram visualization.
+multiple exchanges. Marble strings are parsed into timestamped price events
+and processed synchronously in time order, and the detected opportunities
+are rendered back as a marble diagram.
 """
 
-import rx
-from rx import operators as ops
-from typing import Dict, List, Tuple, Any
+import heapq
+import re
+from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
+from functools import lru_cache
+
+# Characters a marble string may contain; validated in one regex scan
+_MARBLE_RE = re.compile(r"[a-z|-]*")
+
+
+@lru_cache(maxsize=128)
+def _parse_marble_string(marble_string: str) -> Tuple[Tuple[int, str], ...]:
+    """
+    Parse a validated marble string into (timestamp, character) events.
+
+    Every character before the first '|' is one 100ms frame, so a single
+    comprehension over the stream body replaces the per-character branch
+    chain. Results are cached for repeated calls with the same streams.
+    """
+    body = marble_string.partition("|")[0]
+    return tuple(
+        (position * 100, char)
+        for position, char in enumerate(body)
+        if char != "-"
+    )
+
+
+# Defined once at module level with slots: the dataclass decorator no
+# longer runs on every call and instances carry no per-object __dict__
+@dataclass(slots=True)
+class _PriceEvent:
+    timestamp: int
+    exchange: str
+    price: float
+
+
+@dataclass(slots=True)
+class _ArbitrageOpportunity:
+    timestamp: int
+    buy_exchange: str
+    sell_exchange: str
+    buy_price: float
+    sell_price: float
+    profit_percent: float
 
 
 def detect_arbitrage(
     streams: Dict[str, str],
     price_map: Dict[str, float],
     profit_threshold: float = 1.0,
+    top_k: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Detect arbitrage opportunities across crypto exchanges using streams.
@@ -24,6 +67,7 @@ def detect_arbitrage(
         streams: Dictionary mapping exchange names to marble diagram strings
         price_map: Dictionary mapping characters to USD prices
         profit_threshold: Minimum profit percentage required (default 1.0%)
+        top_k: Report only the K most profitable opportunities (default all)
 
     Returns:
         Dictionary containing detected opportunities and marble diagrams
@@ -34,6 +78,9 @@ def detect_arbitrage(
     if not (0.1 <= profit_threshold <= 5.0):
         raise ValueError("Profit threshold must be between 0.1% and 5.0%")
 
+    if top_k is not None and top_k < 1:
+        raise ValueError("top_k must be at least 1")
+
     for exchange, marble in streams.items():
         if len(marble) > 50:
             raise ValueError(
@@ -43,9 +90,11 @@ def detect_arbitrage(
         if not marble.endswith("|"):
             raise ValueError(f"Stream {exchange} must end with '|'")
 
-        valid_chars = set("abcdefghijklmnopqrstuvwxyz-|")
-        invalid_chars = set(marble) - valid_chars
-        if invalid_chars:
+        if not _MARBLE_RE.fullmatch(marble):
+            # The character set is only built to report what is invalid
+            invalid_chars = set(marble) - set(
+                "abcdefghijklmnopqrstuvwxyz-|"
+            )
             raise ValueError(
                 f"Stream {exchange} contains invalid characters: "
                 f"{invalid_chars}"
@@ -54,57 +103,28 @@ def detect_arbitrage(
     # Only check for price mappings of characters that exist in price_map
     # Skip missing characters as per requirements
 
-    @dataclass
-    class _PriceEvent:
-        timestamp: int
-        exchange: str
-        price: float
-
-    @dataclass
-    class _ArbitrageOpportunity:
-        timestamp: int
-        buy_exchange: str
-        sell_exchange: str
-        buy_price: float
-        sell_price: float
-        profit_percent: float
-
-    def _parse_marble_string(marble_string: str) -> List[Tuple[int, str]]:
-        events = []
-        timestamp = 0
-
-        for char in marble_string:
-            if char == "-":
-                timestamp += 100
-            elif char == "|":
-                break
-            elif char.isalpha():
-                events.append((timestamp, char))
-                timestamp += 100
-
-        return events
-
-    def _create_exchange_stream(exchange: str, marble: str) -> rx.Observable:
-        events = _parse_marble_string(marble)
-        price_events = []
-        for timestamp, char in events:
-            # Skip missing price mappings instead of raising error
-            if char in price_map:
-                price_events.append(
-                    _PriceEvent(timestamp, exchange, price_map[char])
-                )
-        return rx.from_(price_events)
+    # Exchanges are tracked by position in streams: latest prices live in
+    # a fixed-size list and are compared by index, not by exchange name
+    exchange_names = list(streams)
+    exchange_indices = {name: i for i, name in enumerate(exchange_names)}
 
     def _detect_arbitrage_opportunities(
-        price_event: _PriceEvent, latest_prices: Dict[str, float]
+        price_event: _PriceEvent,
+        current_index: int,
+        latest_prices: List[float],
+        seen_order: List[int],
     ) -> List[_ArbitrageOpportunity]:
         opportunities = []
         current_exchange = price_event.exchange
         current_price = price_event.price
 
-        for exchange, price in latest_prices.items():
-            if exchange == current_exchange:
+        # Other exchanges are visited in the order they first reported a
+        # price, which decides which duplicate price pair is kept later
+        for index in seen_order:
+            if index == current_index:
                 continue
+            exchange = exchange_names[index]
+            price = latest_prices[index]
 
             # Check if we can buy from current exchange and sell to other
             if current_price < price:
@@ -140,21 +160,6 @@ def detect_arbitrage(
 
         return opportunities
 
-    def _process_event_reactively(state: dict, event: _PriceEvent) -> dict:
-        # Update the latest price for this exchange first
-        state["latest_prices"][event.exchange] = event.price
-
-        # Only detect opportunities when we have at least 2 exchanges
-        # with prices
-        if len(state["latest_prices"]) >= 2:
-            new_opportunities = _detect_arbitrage_opportunities(
-                event, state["latest_prices"]
-            )
-            # Add new opportunities
-            state["opportunities"].extend(new_opportunities)
-
-        return state
-
     def _generate_arbitrage_marble_from_positions(
         opportunities: List[_ArbitrageOpportunity], max_completion_time: int
     ) -> str:
@@ -177,11 +182,12 @@ def detect_arbitrage(
 
     # Calculate shortest stream completion time first
     shortest_completion_time = float("inf")
-    for exchange, marble in streams.items():
-        events = _parse_marble_string(marble)
-        if events:
-            # Find the last event timestamp in this stream
-            last_event_timestamp = max(timestamp for timestamp, _ in events)
+    for marble in streams.values():
+        # The last event is the last character before the first '|' once
+        # trailing idle frames are dropped; no event list is needed
+        events_body = marble.partition("|")[0].rstrip("-")
+        if events_body:
+            last_event_timestamp = (len(events_body) - 1) * 100
             shortest_completion_time = min(
                 shortest_completion_time, last_event_timestamp
             )
@@ -189,17 +195,15 @@ def detect_arbitrage(
     if shortest_completion_time == float("inf"):
         shortest_completion_time = 0
 
-    exchange_observables = [
-        _create_exchange_stream(exchange, marble)
+    # Collect all events directly from the parsed streams, skipping missing
+    # price mappings instead of raising error
+    all_events = [
+        _PriceEvent(timestamp, exchange, price_map[char])
         for exchange, marble in streams.items()
+        for timestamp, char in _parse_marble_string(marble)
+        if char in price_map
     ]
 
-    # Collect all events and process them directly
-    all_events = []
-    for observable in exchange_observables:
-        events = observable.pipe(ops.to_list()).run()
-        all_events.extend(events)
-
     # Filter events to only include those up to shortest stream completion
     all_events = [
         event
@@ -211,72 +215,88 @@ def detect_arbitrage(
     all_events.sort(key=lambda e: (e.timestamp, e.exchange))
 
     # Process events sequentially
-    state = {"latest_prices": {}, "opportunities": []}
+    latest_prices = [0.0] * len(exchange_names)
+    seen_order = []
+    opportunities = []
 
     for event in all_events:
-        state = _process_event_reactively(state, event)
-
-    final_state = state
+        # Update the latest price for this exchange first
+        index = exchange_indices[event.exchange]
+        if index not in seen_order:
+            seen_order.append(index)
+        latest_prices[index] = event.price
 
-    opportunities = final_state.get("opportunities", [])
+        # Only detect opportunities when we have at least 2 exchanges
+        # with prices
+        if len(seen_order) >= 2:
+            opportunities.extend(
+                _detect_arbitrage_opportunities(
+                    event, index, latest_prices, seen_order
+                )
+            )
 
     # FIX: Remove competitive filtering and return all valid opportunities
-    # Just deduplicate opportunities with same buy/sell prices and apply
-    # basic filtering
-    if opportunities:
-        # Deduplicate opportunities with same buy/sell prices
-        deduplicated_opportunities = []
-        seen_price_pairs = set()
-        for opp in opportunities:
-            price_pair = (opp.buy_price, opp.sell_price)
-            if price_pair not in seen_price_pairs:
-                deduplicated_opportunities.append(opp)
-                seen_price_pairs.add(price_pair)
-
-        # Filter by profit threshold
-        filtered_opportunities = [
-            opp
-            for opp in deduplicated_opportunities
-            if opp.profit_percent >= profit_threshold
-        ]
+    # Deduplicate opportunities with same buy/sell prices and filter by
+    # threshold in one pass; equal price pairs always have equal profit,
+    # so the first opportunity kept per pair is the same either way
+    deduplicated_opportunities = {}
+    for opp in opportunities:
+        price_pair = (opp.buy_price, opp.sell_price)
+        if (
+            price_pair not in deduplicated_opportunities
+            and opp.profit_percent >= profit_threshold
+        ):
+            deduplicated_opportunities[price_pair] = opp
+    filtered_opportunities = list(deduplicated_opportunities.values())
+
+    # Sort final result by profit (descending) then by timestamp; when only
+    # the top K are wanted, a bounded heap avoids sorting the whole list
+    # and keeps the same order and tie-breaking as the full sort
+    def rank(opp: _ArbitrageOpportunity) -> Tuple[float, int]:
+        return -opp.profit_percent, opp.timestamp
+
+    if top_k is None:
+        reported_opportunities = sorted(filtered_opportunities, key=rank)
     else:
-        filtered_opportunities = []
-
-    # Sort final result by profit (descending) then by timestamp
-    filtered_opportunities.sort(key=lambda x: (-x.profit_percent, x.timestamp))
-
-    opportunity_dicts = []
-    for opp in filtered_opportunities:
-        opportunity_dicts.append(
-            {
-                "timestamp": opp.timestamp,
-                "buy_exchange": opp.buy_exchange,
-                "sell_exchange": opp.sell_exchange,
-                "buy_price": opp.buy_price,
-                "sell_price": opp.sell_price,
-                "profit_percent": round(opp.profit_percent, 2),
-            }
+        reported_opportunities = heapq.nsmallest(
+            top_k, filtered_opportunities, key=rank
         )
 
+    opportunity_dicts = [
+        {
+            "timestamp": opp.timestamp,
+            "buy_exchange": opp.buy_exchange,
+            "sell_exchange": opp.sell_exchange,
+            "buy_price": opp.buy_price,
+            "sell_price": opp.sell_price,
+            "profit_percent": round(opp.profit_percent, 2),
+        }
+        for opp in reported_opportunities
+    ]
+
     # Generate marble diagram based on position-based timing
     # FIX: Use number of events instead of timestamps
     # The marble length should represent the number of events (a-z characters)
-    max_events = 0
-    for marble_str in streams.values():
-        event_count = sum(1 for char in marble_str if char.isalpha())
-        max_events = max(max_events, event_count)
+    # Validated streams hold only a-z, '-' and '|', so the event count is
+    # what is left after the C-level str.count scans for the other two
+    max_events = max(
+        len(marble_str) - marble_str.count("-") - marble_str.count("|")
+        for marble_str in streams.values()
+    )
 
     # Create marble based on number of events
     if max_events <= 0:
         arbitrage_marble = "|"
     else:
-        marble = ["-"] * max_events
+        # One byte per position, decoded once instead of joining a list
+        # of one-character strings
+        marble = bytearray(b"-" * max_events)
         for opp in filtered_opportunities:
             # Convert timestamp to event position (each event is 200ms apart)
             position = opp.timestamp // 200
-            if 0 <= position < len(marble):
-                marble[position] = "O"
-        arbitrage_marble = "".join(marble) + "|"
+            if 0 <= position < max_events:
+                marble[position] = ord("O")
+        arbitrage_marble = marble.decode("ascii") + "|"
 
     return {
         "opportunities": opportunity_dicts,
@@ -178,3 +178,18 @@ class TestDetectArbitrage(unittest.TestCase):
         result = detect_arbitrage(streams, price_map)
         self.assertEqual(result["opportunities"], [])
         self.assertEqual(result["marble_diagrams"]["arbitrage"], "|")
+
+    def test_top_k_returns_most_profitable_opportunities(self):
+        streams = {
+            "exchange_A": "a-b-c|",
+            "exchange_B": "b-c-a|",
+            "exchange_C": "c-a-b|"
+        }
+        price_map = {"a": 100, "b": 102, "c": 105}
+        full = detect_arbitrage(streams, price_map)
+        top = detect_arbitrage(streams, price_map, top_k=2)
+        self.assertGreater(len(full["opportunities"]), 2)
+        self.assertEqual(top["opportunities"], full["opportunities"][:2])
+        self.assertEqual(top["marble_diagrams"], full["marble_diagrams"])
+        with self.assertRaises(ValueError):
+            detect_arbitrage(streams, price_map, top_k=0)
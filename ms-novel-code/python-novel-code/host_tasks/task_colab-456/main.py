@@ -1,11 +1,27 @@
 
 """Payment gateway factory implementation."""
 
+import time
 from abc import ABC, abstractmethod
 from typing import Dict
 from datetime import datetime
 from dataclasses import dataclass
 
+# (epoch second, formatted local time); swapped as one tuple so concurrent
+# callers never see a second paired with another second's text
+_timestamp_cache = (0, "")
+
+
+def _transaction_timestamp() -> str:
+    """Return the current local time formatted for transaction IDs."""
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, text = _timestamp_cache
+    if second != cached_second:
+        text = time.strftime("%Y%m%d%H%M%S", time.localtime(second))
+        _timestamp_cache = (second, text)
+    return text
+
 
 @dataclass
 class PaymentResult:
@@ -29,6 +45,8 @@ class PaymentResult:
 class PaymentProcessor(ABC):
     """Abstract base class for payment processors."""
 
+    __slots__ = ()
+
     @abstractmethod
     def process_payment(
         self, amount: float, currency: str, customer_info: Dict
@@ -49,11 +67,10 @@ class PaymentProcessorFactory(ABC):
 class CreditCardProcessor(PaymentProcessor):
     """Credit card payment processor."""
 
-    def __init__(self):
-        """Initialize credit card processor."""
-        self.supported_currencies = {"USD", "EUR", "GBP"}
-        self.fee_percentage = 0.029
-        self.flat_fee = 0.30
+    # Shared by all instances; nothing here changes per processor
+    supported_currencies = frozenset({"USD", "EUR", "GBP"})
+    fee_percentage = 0.029
+    flat_fee = 0.30
 
     def process_payment(
         self, amount: float, currency: str, customer_info: Dict
@@ -73,9 +90,7 @@ class CreditCardProcessor(PaymentProcessor):
 
         fee = round(amount * self.fee_percentage + self.flat_fee, 2)
         customer_id = customer_info.get("customer_id", "unknown")
-        transaction_id = (
-            f"CC_{datetime.now().strftime('%Y%m%d%H%M%S')}_{customer_id}"
-        )
+        transaction_id = f"CC_{_transaction_timestamp()}_{customer_id}"
 
         return PaymentResult(
             True,
@@ -97,11 +112,9 @@ class CreditCardProcessor(PaymentProcessor):
 class PayPalProcessor(PaymentProcessor):
     """PayPal payment processor."""
 
-    def __init__(self):
-        """Initialize PayPal processor."""
-        self.supported_currencies = {"USD", "EUR", "GBP", "CAD", "AUD"}
-        self.fee_percentage = 0.0349
-        self.flat_fee = 0.49
+    supported_currencies = frozenset({"USD", "EUR", "GBP", "CAD", "AUD"})
+    fee_percentage = 0.0349
+    flat_fee = 0.49
 
     def process_payment(
         self, amount: float, currency: str, customer_info: Dict
@@ -121,9 +134,7 @@ class PayPalProcessor(PaymentProcessor):
 
         fee = round(amount * self.fee_percentage + self.flat_fee, 2)
         customer_id = customer_info.get("customer_id", "unknown")
-        transaction_id = (
-            f"PP_{datetime.now().strftime('%Y%m%d%H%M%S')}_{customer_id}"
-        )
+        transaction_id = f"PP_{_transaction_timestamp()}_{customer_id}"
 
         return PaymentResult(
             True,
@@ -144,11 +155,9 @@ class PayPalProcessor(PaymentProcessor):
 class BankTransferProcessor(PaymentProcessor):
     """Bank transfer payment processor."""
 
-    def __init__(self):
-        """Initialize bank transfer processor."""
-        self.supported_currencies = {"USD", "EUR"}
-        self.flat_fee = 15.0
-        self.minimum_amount = 100.0
+    supported_currencies = frozenset({"USD", "EUR"})
+    flat_fee = 15.0
+    minimum_amount = 100.0
 
     def process_payment(
         self, amount: float, currency: str, customer_info: Dict
@@ -173,9 +182,7 @@ class BankTransferProcessor(PaymentProcessor):
             )
 
         customer_id = customer_info.get("customer_id", "unknown")
-        transaction_id = (
-            f"BT_{datetime.now().strftime('%Y%m%d%H%M%S')}_{customer_id}"
-        )
+        transaction_id = f"BT_{_transaction_timestamp()}_{customer_id}"
 
         return PaymentResult(
             True,
@@ -203,13 +210,41 @@ class StandardPaymentProcessorFactory(PaymentProcessorFactory):
             "paypal": PayPalProcessor,
             "bank_transfer": BankTransferProcessor,
         }
+        # Processors hold no per-transaction state, so one instance of
+        # each is shared by every transaction this factory serves
+        self._instances = {
+            method: processor_class()
+            for method, processor_class in self._processors.items()
+        }
 
     def create_processor(self, payment_method: str) -> PaymentProcessor:
-        """Create processor for the given payment method."""
-        processor_class = self._processors.get(payment_method)
-        if not processor_class:
+        """Return the processor for the given payment method."""
+        processor = self._instances.get(payment_method)
+        if not processor:
             raise ValueError(f"Unsupported payment method: {payment_method}")
-        return processor_class()
+        return processor
+
+
+class _MockProcessor(PaymentProcessor):
+    """Processor returning a configured result, used by the fake factory."""
+
+    __slots__ = ("result_config", "fee")
+
+    def __init__(self, result_config: Dict, fee: float):
+        """Initialize mock processor with its configured result and fee."""
+        self.result_config = result_config
+        self.fee = fee
+
+    def process_payment(
+        self, amount: float, currency: str, customer_info: Dict
+    ) -> PaymentResult:
+        """Return the configured payment result."""
+        return PaymentResult(
+            self.result_config["success"],
+            self.result_config["transaction_id"],
+            self.result_config["message"],
+            self.fee,
+        )
 
 
 class FakePaymentProcessorFactory(PaymentProcessorFactory):
@@ -243,22 +278,7 @@ class FakePaymentProcessorFactory(PaymentProcessorFactory):
         if payment_method not in self._mock_results:
             raise ValueError(f"Unsupported payment method: {payment_method}")
 
-        class MockProcessor(PaymentProcessor):
-            def __init__(self, result_config, fee):
-                self.result_config = result_config
-                self.fee = fee
-
-            def process_payment(
-                self, amount: float, currency: str, customer_info: Dict
-            ) -> PaymentResult:
-                return PaymentResult(
-                    self.result_config["success"],
-                    self.result_config["transaction_id"],
-                    self.result_config["message"],
-                    self.fee,
-                )
-
-        return MockProcessor(
+        return _MockProcessor(
             self._mock_results[payment_method],
             self._mock_fees.get(payment_method, 0.0),
         )
@@ -305,12 +325,16 @@ class PaymentGateway:
             }
 
 
+# The standard factory is stateless, so process_transaction reuses one
+# instead of rebuilding it and its processors on every call
+_STANDARD_FACTORY = StandardPaymentProcessorFactory()
+
+
 def process_transaction(
     payment_method: str, amount: float, currency: str, customer_info: Dict
 ) -> Dict:
     """Process a transaction using the standard factory."""
-    factory = StandardPaymentProcessorFactory()
-    gateway = PaymentGateway(factory)
+    gateway = PaymentGateway(_STANDARD_FACTORY)
     return gateway.process_transaction(
         payment_method, amount, currency, customer_info
     )